@@ -6,30 +6,46 @@ A professional desktop application for glucose level monitoring and analysis
 import sys
 import csv
 import json
+import math
+import os
+import shutil
 import sqlite3
+import tempfile
+import threading
+import time
+import wave
+from bisect import bisect_left, bisect_right, insort
+from collections import OrderedDict, namedtuple
 from datetime import datetime, timedelta
+from operator import itemgetter
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QPushButton, QLineEdit, 
-                             QTableWidget, QTableWidgetItem, QFrame, QComboBox,
+                             QTableView, QListView, QStyledItemDelegate, QFrame, QComboBox,
                              QHeaderView, QMessageBox, QFileDialog, QDialog,
                              QGridLayout, QSpinBox, QDoubleSpinBox, QGroupBox,
-                             QRadioButton, QButtonGroup, QProgressBar, QTabWidget,
+                             QRadioButton, QButtonGroup, QTabWidget,
                              QScrollArea, QCheckBox)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QDate
-from PyQt5.QtGui import QFont, QColor, QPalette, QIcon
+from PyQt5.QtCore import (Qt, QTimer, pyqtSignal, QDate, QUrl, QAbstractTableModel, QModelIndex,
+                          QAbstractListModel, QObject, QRect, QRectF, QSize,
+                          QRunnable, QThread, QThreadPool, QSignalBlocker)
+from PyQt5.QtGui import QFont, QFontMetrics, QColor, QPalette, QIcon, QPainter, QPen
 from PyQt5.QtPrintSupport import QPrinter, QPrintDialog
+try:
+    from PyQt5.QtMultimedia import QSoundEffect
+except ImportError:  # No Qt multimedia backend - fall back to winsound beeps
+    QSoundEffect = None
 import matplotlib
 matplotlib.use('Qt5Agg')
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
-import winsound
-import statistics
-from reportlab.lib.pagesizes import letter
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
-from reportlab.lib.units import inch
+from matplotlib.colors import to_rgba
+from matplotlib.cbook import boxplot_stats
+from matplotlib.ticker import AutoLocator, FixedLocator
+import numpy as np
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to plain NumPy reductions
+    njit = None
 
 
 class GlucoseAnalyzer:
@@ -58,6 +74,59 @@ class GlucoseAnalyzer:
     NORMAL_HIGH = 140    # Upper limit for postprandial glucose
     WARNING_HIGH = 180   # Hyperglycemia threshold
     
+    # Bucket boundaries: lows are exclusive (< 54, < 70) so they are bisected
+    # right, highs inclusive (<= 140, <= 180) so they are bisected left
+    LOW_THRESHOLDS = (CRITICAL_LOW, WARNING_LOW)
+    HIGH_THRESHOLDS = (NORMAL_HIGH, WARNING_HIGH)
+    
+    # Fixed analysis outcome for each bucket, indexed by GlucoseAnalyzer.bucket(value)
+    STATUS_TABLE = (
+        {
+            'status': 'CRITICAL LOW',
+            'color': '#FF4444',
+            'severity': 'critical',
+            'message': '⚠️ CRITICAL: Severe Hypoglycemia! Immediate action required!',
+            'alarm': True
+        },
+        {
+            'status': 'WARNING LOW',
+            'color': '#FFA500',
+            'severity': 'warning',
+            'message': '⚠️ WARNING: Low glucose level detected.',
+            'alarm': True
+        },
+        {
+            'status': 'NORMAL',
+            'color': '#4CAF50',
+            'severity': 'normal',
+            'message': '✓ Glucose level is within normal range.',
+            'alarm': False
+        },
+        {
+            'status': 'WARNING HIGH',
+            'color': '#FFA500',
+            'severity': 'warning',
+            'message': '⚠️ WARNING: Elevated glucose level detected.',
+            'alarm': True
+        },
+        {
+            'status': 'CRITICAL HIGH',
+            'color': '#FF4444',
+            'severity': 'critical',
+            'message': '⚠️ CRITICAL: Severe Hyperglycemia! Immediate action required!',
+            'alarm': True
+        }
+    )
+    
+    @staticmethod
+    def bucket(glucose_value):
+        """Index into STATUS_TABLE for a single glucose value"""
+        if math.isnan(glucose_value):
+            # Below no limit, so NaN falls through to CRITICAL HIGH
+            return len(GlucoseAnalyzer.STATUS_TABLE) - 1
+        return (bisect_right(GlucoseAnalyzer.LOW_THRESHOLDS, glucose_value)
+                + bisect_left(GlucoseAnalyzer.HIGH_THRESHOLDS, glucose_value))
+    
     @staticmethod
     def analyze(glucose_value):
         """
@@ -69,217 +138,399 @@ class GlucoseAnalyzer:
         Returns:
             dict: Contains status, color, severity, and message
         """
-        result = {
+        return {
             'value': glucose_value,
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            **GlucoseAnalyzer.STATUS_TABLE[GlucoseAnalyzer.bucket(glucose_value)]
         }
+    
+    @staticmethod
+    def analyze_array(glucose_values):
+        """
+        Classify a batch of glucose values in one vectorized pass
         
-        if glucose_value < GlucoseAnalyzer.CRITICAL_LOW:
-            result['status'] = 'CRITICAL LOW'
-            result['color'] = '#FF4444'
-            result['severity'] = 'critical'
-            result['message'] = '⚠️ CRITICAL: Severe Hypoglycemia! Immediate action required!'
-            result['alarm'] = True
-            
-        elif glucose_value < GlucoseAnalyzer.WARNING_LOW:
-            result['status'] = 'WARNING LOW'
-            result['color'] = '#FFA500'
-            result['severity'] = 'warning'
-            result['message'] = '⚠️ WARNING: Low glucose level detected.'
-            result['alarm'] = True
-            
-        elif glucose_value <= GlucoseAnalyzer.NORMAL_HIGH:
-            result['status'] = 'NORMAL'
-            result['color'] = '#4CAF50'
-            result['severity'] = 'normal'
-            result['message'] = '✓ Glucose level is within normal range.'
-            result['alarm'] = False
-            
-        elif glucose_value <= GlucoseAnalyzer.WARNING_HIGH:
-            result['status'] = 'WARNING HIGH'
-            result['color'] = '#FFA500'
-            result['severity'] = 'warning'
-            result['message'] = '⚠️ WARNING: Elevated glucose level detected.'
-            result['alarm'] = True
-            
-        else:  # > WARNING_HIGH
-            result['status'] = 'CRITICAL HIGH'
-            result['color'] = '#FF4444'
-            result['severity'] = 'critical'
-            result['message'] = '⚠️ CRITICAL: Severe Hyperglycemia! Immediate action required!'
-            result['alarm'] = True
+        Args:
+            glucose_values (array-like): Glucose levels in mg/dL
             
-        return result
+        Returns:
+            np.ndarray: Index into STATUS_TABLE for each value
+        """
+        values = np.asarray(glucose_values, dtype=np.float64)
+        # searchsorted orders NaN after every threshold, matching bucket()
+        return (np.searchsorted(GlucoseAnalyzer.LOW_THRESHOLDS, values, side='right')
+                + np.searchsorted(GlucoseAnalyzer.HIGH_THRESHOLDS, values, side='left'))
+
+
+# SQL statements used by DatabaseManager, kept as module constants so each
+# call reuses the same text (and therefore the same cached prepared statement)
+_SQL_ADD_PATIENT = '''
+    INSERT INTO patients (name, age, diabetes_type, created_date)
+    VALUES (?, ?, ?, ?)
+'''
+_SQL_GET_PATIENTS = 'SELECT * FROM patients'
+_SQL_GET_PATIENT_BY_NAME = 'SELECT * FROM patients WHERE name = ?'
+_SQL_UPDATE_PATIENT_TARGETS = '''
+    UPDATE patients SET target_min = ?, target_max = ?
+    WHERE id = ?
+'''
+_SQL_ADD_READING = '''
+    INSERT INTO readings (patient_id, glucose_value, status, condition, timestamp)
+    VALUES (?, ?, ?, ?, CAST(strftime('%s', ?, 'utc') AS INTEGER))
+'''
+_SQL_GET_READINGS = '''
+    SELECT id, patient_id, glucose_value, status, condition,
+           strftime('%Y-%m-%d %H:%M:%S', readings.timestamp, 'unixepoch', 'localtime') AS timestamp
+    FROM readings
+    WHERE patient_id = ?
+    ORDER BY readings.timestamp DESC, id DESC
+    LIMIT ? OFFSET ?
+'''
+_SQL_COUNT_READINGS = 'SELECT COUNT(*) FROM readings WHERE patient_id = ?'
+# Glucose values only (oldest first), for plots that need no other column
+_SQL_GET_READING_VALUES = '''
+    SELECT glucose_value FROM readings
+    WHERE patient_id = ?
+    ORDER BY timestamp, id
+'''
+_SQL_GET_READING_VALUES_SINCE = '''
+    SELECT glucose_value FROM readings
+    WHERE patient_id = ? AND timestamp >= ?
+    ORDER BY timestamp, id
+'''
+# The same selection returned oldest first: the newest-first page is picked in the
+# subquery (using the index), then re-sorted into its exact reverse
+_SQL_GET_READINGS_ASC = '''
+    SELECT id, patient_id, glucose_value, status, condition,
+           strftime('%Y-%m-%d %H:%M:%S', ts, 'unixepoch', 'localtime') AS timestamp
+    FROM (
+        SELECT id, patient_id, glucose_value, status, condition, readings.timestamp AS ts
+        FROM readings
+        WHERE patient_id = ?
+        ORDER BY readings.timestamp DESC, id DESC
+        LIMIT ? OFFSET ?
+    )
+    ORDER BY ts, id
+'''
+_SQL_ADD_GOAL = '''
+    INSERT INTO goals (patient_id, goal_type, target_value, current_value, start_date, end_date)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+_SQL_GET_GOALS = 'SELECT * FROM goals WHERE patient_id = ?'
+_SQL_GET_GOAL = 'SELECT * FROM goals WHERE id = ?'
+_SQL_UPDATE_GOAL_PROGRESS = '''
+    UPDATE goals SET current_value = ?, achieved = ?
+    WHERE id = ?
+'''
+
+# Column getters for query result rows (C-level, unlike per-row generator expressions)
+_get_first_column = itemgetter(0)
+_get_glucose_value = itemgetter('glucose_value')
+_get_timestamp = itemgetter('timestamp')
+_get_condition = itemgetter('condition')
+_get_status = itemgetter('status')
+_get_export_columns = itemgetter('timestamp', 'glucose_value', 'status', 'condition')
 
 
 class DatabaseManager:
     """
     Manages SQLite database operations for persistent data storage
+    
+    A single long-lived connection is kept open for the lifetime of the
+    manager (WAL journal, autocommit) instead of reconnecting per call.
+    
+    Reading timestamps are stored as INTEGER unix-epoch seconds but are
+    exchanged with callers as local "%Y-%m-%d %H:%M:%S" strings.
+    
+    get_readings / get_reading_values results are cached per query arguments
+    and dropped whenever readings are added for that patient. Values for a
+    last-N-days window also expire after READINGS_CACHE_TTL seconds, since
+    the window moves on even when no readings are added. At most
+    READINGS_CACHE_SIZE results are kept, least recently used evicted first;
+    full-history readings and pages past the first are not cached at all.
     """
     
+    READINGS_CACHE_TTL = 60
+    READINGS_CACHE_SIZE = 16
+    
     def __init__(self, db_name="glucometer_data.db"):
         self.db_name = db_name
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_name, check_same_thread=False,
+                                    isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self._readings_cache = OrderedDict()
         self.init_database()
     
     def init_database(self):
         """Initialize database with required tables"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        # Readings table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS readings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                patient_id INTEGER,
-                glucose_value REAL,
-                status TEXT,
-                condition TEXT,
-                timestamp TEXT,
-                FOREIGN KEY (patient_id) REFERENCES patients(id)
-            )
-        ''')
-        
-        # Patients table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS patients (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT UNIQUE,
-                age INTEGER,
-                diabetes_type TEXT,
-                target_min REAL DEFAULT 70,
-                target_max REAL DEFAULT 140,
-                created_date TEXT
-            )
-        ''')
-        
-        # Goals table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS goals (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                patient_id INTEGER,
-                goal_type TEXT,
-                target_value REAL,
-                current_value REAL,
-                start_date TEXT,
-                end_date TEXT,
-                achieved INTEGER DEFAULT 0,
-                FOREIGN KEY (patient_id) REFERENCES patients(id)
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
+        with self.lock:
+            # Connection tuning - applied once for the persistent connection
+            self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('PRAGMA synchronous=NORMAL')
+            self.conn.execute('PRAGMA temp_store=MEMORY')
+            self.conn.execute('PRAGMA cache_size=-20000')
+            
+            self.conn.execute('BEGIN')
+            
+            # Readings created before timestamps became epoch integers are moved
+            # aside here and copied into the new table below
+            columns = {row[1]: row[2] for row in self.conn.execute('PRAGMA table_info(readings)')}
+            migrate_text_timestamps = columns.get('timestamp', '').upper() == 'TEXT'
+            if migrate_text_timestamps:
+                self.conn.execute('ALTER TABLE readings RENAME TO readings_text_ts')
+            
+            # Readings table
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS readings (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    patient_id INTEGER,
+                    glucose_value REAL,
+                    status TEXT,
+                    condition TEXT,
+                    timestamp INTEGER NOT NULL,
+                    FOREIGN KEY (patient_id) REFERENCES patients(id)
+                )
+            ''')
+            
+            if migrate_text_timestamps:
+                # Timestamps that do not parse are stamped with the migration time
+                # rather than breaking NOT NULL and keeping the app from starting
+                try:
+                    self.conn.execute('''
+                        INSERT INTO readings (id, patient_id, glucose_value, status, condition, timestamp)
+                        SELECT id, patient_id, glucose_value, status, condition,
+                               COALESCE(CAST(strftime('%s', timestamp, 'utc') AS INTEGER),
+                                        CAST(strftime('%s', 'now') AS INTEGER))
+                        FROM readings_text_ts
+                    ''')
+                    self.conn.execute('DROP TABLE readings_text_ts')
+                except sqlite3.Error:
+                    self.conn.execute('ROLLBACK')
+                    raise
+            
+            # Patients table
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS patients (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT UNIQUE,
+                    age INTEGER,
+                    diabetes_type TEXT,
+                    target_min REAL DEFAULT 70,
+                    target_max REAL DEFAULT 140,
+                    created_date TEXT
+                )
+            ''')
+            
+            # Goals table
+            self.conn.execute('''
+                CREATE TABLE IF NOT EXISTS goals (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    patient_id INTEGER,
+                    goal_type TEXT,
+                    target_value REAL,
+                    current_value REAL,
+                    start_date TEXT,
+                    end_date TEXT,
+                    achieved INTEGER DEFAULT 0,
+                    FOREIGN KEY (patient_id) REFERENCES patients(id)
+                )
+            ''')
+            
+            # Covers both the patient filter and the newest-first ordering in get_readings
+            # (id breaks ties between same-second readings); carrying glucose_value
+            # makes get_reading_values an index-only scan
+            create_index = not self.conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_readings_patient_ts_id_value'"
+            ).fetchone()
+            self.conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_readings_patient_ts_id_value
+                ON readings (patient_id, timestamp DESC, id DESC, glucose_value)
+            ''')
+            
+            self.conn.execute('COMMIT')
+            
+            # Refresh planner statistics so a new index or migrated table is picked up
+            if create_index or migrate_text_timestamps:
+                self.conn.execute('ANALYZE')
+    
+    def close(self):
+        """Close the persistent database connection"""
+        with self.lock:
+            self.conn.close()
     
     def add_patient(self, name, age, diabetes_type):
         """Add a new patient"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        try:
-            cursor.execute('''
-                INSERT INTO patients (name, age, diabetes_type, created_date)
-                VALUES (?, ?, ?, ?)
-            ''', (name, age, diabetes_type, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-            conn.commit()
-            patient_id = cursor.lastrowid
-            conn.close()
-            return patient_id
-        except sqlite3.IntegrityError:
-            conn.close()
-            return None
+        with self.lock:
+            try:
+                cursor = self.conn.execute(_SQL_ADD_PATIENT, (
+                    name, age, diabetes_type, datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+                return cursor.lastrowid
+            except sqlite3.IntegrityError:
+                return None
     
     def get_patients(self):
         """Get all patients"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM patients')
-        patients = cursor.fetchall()
-        conn.close()
-        return patients
+        with self.lock:
+            return self.conn.execute(_SQL_GET_PATIENTS).fetchall()
     
     def get_patient_by_name(self, name):
         """Get patient by name"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM patients WHERE name = ?', (name,))
-        patient = cursor.fetchone()
-        conn.close()
-        return patient
+        with self.lock:
+            return self.conn.execute(_SQL_GET_PATIENT_BY_NAME, (name,)).fetchone()
     
     def update_patient_targets(self, patient_id, target_min, target_max):
         """Update patient target ranges"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('''
-            UPDATE patients SET target_min = ?, target_max = ?
-            WHERE id = ?
-        ''', (target_min, target_max, patient_id))
-        conn.commit()
-        conn.close()
+        with self.lock:
+            self.conn.execute(_SQL_UPDATE_PATIENT_TARGETS, (target_min, target_max, patient_id))
     
     def add_reading(self, patient_id, glucose_value, status, condition, timestamp):
         """Add a new glucose reading"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO readings (patient_id, glucose_value, status, condition, timestamp)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (patient_id, glucose_value, status, condition, timestamp))
-        conn.commit()
-        conn.close()
-    
-    def get_readings(self, patient_id, days=None):
-        """Get readings for a patient, optionally filtered by days"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        if days:
-            cutoff_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
-            cursor.execute('''
-                SELECT * FROM readings 
-                WHERE patient_id = ? AND timestamp >= ?
-                ORDER BY timestamp DESC
-            ''', (patient_id, cutoff_date))
-        else:
-            cursor.execute('''
-                SELECT * FROM readings 
-                WHERE patient_id = ?
-                ORDER BY timestamp DESC
-            ''', (patient_id,))
+        with self.lock:
+            self.conn.execute(_SQL_ADD_READING, (patient_id, glucose_value, status, condition, timestamp))
+            self._invalidate_readings(patient_id)
+    
+    def get_readings(self, patient_id, limit=None, offset=0, order='DESC'):
+        """
+        Get readings for a patient
         
-        readings = cursor.fetchall()
-        conn.close()
-        return readings
+        Args:
+            patient_id: Patient to fetch readings for
+            limit: Maximum number of readings to return (None for all)
+            offset: Number of newest readings to skip, for paging
+            order: 'DESC' for newest first, 'ASC' to return the same
+                   readings oldest first
+        """
+        with self.lock:
+            key = (patient_id, limit, offset, order)
+            readings = self._cached_readings(key, None)
+            if readings is None:
+                sql = _SQL_GET_READINGS_ASC if order == 'ASC' else _SQL_GET_READINGS
+                page = (-1 if limit is None else limit, offset)  # LIMIT -1 means no limit
+                readings = self.conn.execute(sql, (patient_id, *page)).fetchall()
+                if offset == 0 and limit is not None:
+                    self._store_readings(key, readings)
+            
+            # Callers get their own list so they may reorder it freely
+            return list(readings)
+    
+    def count_readings(self, patient_id):
+        """Get the total number of readings stored for a patient"""
+        with self.lock:
+            return self.conn.execute(_SQL_COUNT_READINGS, (patient_id,)).fetchone()[0]
+    
+    def get_reading_values(self, patient_id, days=None):
+        """
+        Get a patient's glucose values as a float64 array, oldest first
+        (readings sharing a timestamp in insertion order)
+        
+        Args:
+            patient_id: Patient to fetch values for
+            days: Only readings from the last N days (None for all)
+        """
+        with self.lock:
+            key = (patient_id, days, 'values')
+            values = self._cached_readings(key, days)
+            if values is None:
+                if days:
+                    cutoff_ts = int((datetime.now() - timedelta(days=days)).timestamp())
+                    cursor = self.conn.execute(_SQL_GET_READING_VALUES_SINCE, (patient_id, cutoff_ts))
+                else:
+                    cursor = self.conn.execute(_SQL_GET_READING_VALUES, (patient_id,))
+                values = np.fromiter(map(_get_first_column, cursor), dtype=np.float64)
+                values.flags.writeable = False  # Shared by every caller until invalidated
+                self._store_readings(key, values)
+            return values
+    
+    def _cached_readings(self, key, days):
+        """Return a cached readings result, or None if missing/expired (lock must be held)"""
+        entry = self._readings_cache.get(key)
+        if entry is None:
+            return None
+        cached_at, result = entry
+        if days and time.monotonic() - cached_at >= self.READINGS_CACHE_TTL:
+            del self._readings_cache[key]
+            return None
+        self._readings_cache.move_to_end(key)
+        return result
+    
+    def _store_readings(self, key, result):
+        """Cache a readings result, evicting the least recently used (lock must be held)"""
+        self._readings_cache[key] = (time.monotonic(), result)
+        self._readings_cache.move_to_end(key)
+        if len(self._readings_cache) > self.READINGS_CACHE_SIZE:
+            self._readings_cache.popitem(last=False)
+    
+    def _invalidate_readings(self, patient_id):
+        """Drop cached get_readings results for a patient (lock must be held)"""
+        for key in [key for key in self._readings_cache if key[0] == patient_id]:
+            del self._readings_cache[key]
     
     def add_goal(self, patient_id, goal_type, target_value, start_date, end_date):
-        """Add a new goal"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('''
-            INSERT INTO goals (patient_id, goal_type, target_value, current_value, start_date, end_date)
-            VALUES (?, ?, ?, ?, ?, ?)
-        ''', (patient_id, goal_type, target_value, 0, start_date, end_date))
-        conn.commit()
-        conn.close()
+        """Add a new goal, returning its row"""
+        with self.lock:
+            cursor = self.conn.execute(_SQL_ADD_GOAL, (patient_id, goal_type, target_value, 0, start_date, end_date))
+            return self.conn.execute(_SQL_GET_GOAL, (cursor.lastrowid,)).fetchone()
     
     def get_goals(self, patient_id):
         """Get all goals for a patient"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM goals WHERE patient_id = ?', (patient_id,))
-        goals = cursor.fetchall()
-        conn.close()
-        return goals
+        with self.lock:
+            return self.conn.execute(_SQL_GET_GOALS, (patient_id,)).fetchall()
     
     def update_goal_progress(self, goal_id, current_value, achieved=0):
         """Update goal progress"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        cursor.execute('''
-            UPDATE goals SET current_value = ?, achieved = ?
-            WHERE id = ?
-        ''', (current_value, achieved, goal_id))
-        conn.commit()
-        conn.close()
+        with self.lock:
+            self.conn.execute(_SQL_UPDATE_GOAL_PROGRESS, (current_value, achieved, goal_id))
+
+
+def _stats_kernel_loop(values):
+    """Single pass over values returning moments, extrema and status bucket counts"""
+    total = 0.0
+    total_sq = 0.0
+    lowest = values[0] if values.size else 0.0
+    highest = lowest
+    critical_low = warning_low = normal = warning_high = critical_high = 0
+    
+    for v in values:
+        total += v
+        total_sq += v * v
+        if v < lowest:
+            lowest = v
+        if v > highest:
+            highest = v
+        
+        if v < 54:
+            critical_low += 1
+        elif v < 70:
+            warning_low += 1
+        elif v <= 140:
+            normal += 1
+        elif v <= 180:
+            warning_high += 1
+        else:
+            critical_high += 1
+    
+    return (total, total_sq, lowest, highest,
+            critical_low, warning_low, normal, warning_high, critical_high)
+
+
+def _stats_kernel_numpy(values):
+    """NumPy equivalent of _stats_kernel_loop used when numba is not installed"""
+    if not values.size:
+        return 0.0, 0.0, 0.0, 0.0, 0, 0, 0, 0, 0
+    
+    # One quantizing pass assigns every value its status bucket
+    buckets = np.bincount(GlucoseAnalyzer.analyze_array(values), minlength=len(GlucoseAnalyzer.STATUS_TABLE))
+    
+    return (float(values.sum()), float(np.dot(values, values)),
+            float(values.min()), float(values.max()),
+            *(int(count) for count in buckets))
+
+
+if njit is not None:
+    _stats_kernel = njit(cache=True, fastmath=True)(_stats_kernel_loop)
+    _stats_kernel(np.zeros(0, dtype=np.float64))  # Compile once at import
+else:
+    _stats_kernel = _stats_kernel_numpy
 
 
 class StatisticsCalculator:
@@ -289,44 +540,492 @@ class StatisticsCalculator:
     
     @staticmethod
     def calculate_statistics(readings):
-        """Calculate comprehensive statistics from readings"""
-        if not readings:
+        """
+        Calculate comprehensive statistics from readings
+        
+        Args:
+            readings: Database reading rows, or a NumPy array of glucose values
+        """
+        if isinstance(readings, np.ndarray):
+            values = readings.astype(np.float64, copy=False)
+        elif readings:
+            values = np.fromiter(map(_get_glucose_value, readings), dtype=np.float64, count=len(readings))
+        else:
+            return None
+        
+        count = values.size
+        if not count:
             return None
         
-        values = [r[2] for r in readings]  # glucose_value is at index 2
+        (total, total_sq, lowest, highest,
+         critical_low, warning_low, normal_count, warning_high, critical_high) = _stats_kernel(values)
+        
+        average = total / count
+        variance = (total_sq - total * average) / (count - 1) if count > 1 else 0.0
         
         stats = {
-            'count': len(values),
-            'average': statistics.mean(values),
-            'median': statistics.median(values),
-            'std_dev': statistics.stdev(values) if len(values) > 1 else 0,
-            'min': min(values),
-            'max': max(values),
-            'range': max(values) - min(values)
+            'count': count,
+            'average': float(average),
+            'median': float(np.median(values)),
+            'std_dev': float(np.sqrt(max(variance, 0.0))) if count > 1 else 0,
+            'min': float(lowest),
+            'max': float(highest),
+            'range': float(highest - lowest)
         }
         
         # Calculate time in range
-        normal_count = sum(1 for v in values if 70 <= v <= 140)
-        stats['time_in_range'] = (normal_count / len(values)) * 100
+        stats['time_in_range'] = (normal_count / count) * 100
         
         # Estimate A1C (formula: A1C ≈ (average_glucose + 46.7) / 28.7)
         # Based on ADAG study - converts average glucose to estimated A1C
         stats['estimated_a1c'] = round((stats['average'] + 46.7) / 28.7, 1)
         
         # Count by status - Updated to match ADA/ISO 15197 thresholds
-        stats['critical_low'] = sum(1 for v in values if v < 54)      # Severe hypoglycemia
-        stats['warning_low'] = sum(1 for v in values if 54 <= v < 70)  # Hypoglycemia
-        stats['normal'] = normal_count
-        stats['warning_high'] = sum(1 for v in values if 140 < v <= 180)  # Hyperglycemia
-        stats['critical_high'] = sum(1 for v in values if v > 180)    # Severe hyperglycemia
+        stats['critical_low'] = int(critical_low)      # Severe hypoglycemia
+        stats['warning_low'] = int(warning_low)        # Hypoglycemia
+        stats['normal'] = int(normal_count)
+        stats['warning_high'] = int(warning_high)      # Hyperglycemia
+        stats['critical_high'] = int(critical_high)    # Severe hyperglycemia
         
         return stats
 
 
-class TrendPlotWidget(QWidget):
+class RunningStatistics:
     """
-    Custom widget for plotting glucose trends using matplotlib
-    Embedded matplotlib canvas in PyQt5
+    Incrementally maintained statistics for a growing set of readings
+    
+    Mean and variance use Welford's online update and the median comes from
+    a sorted list, so adding a reading avoids rescanning the whole history.
+    stats() returns the same dict as StatisticsCalculator.calculate_statistics.
+    """
+    
+    def __init__(self, values=()):
+        values = np.asarray(values, dtype=np.float64)
+        self.count = int(values.size)
+        self.mean = float(values.mean()) if self.count else 0.0
+        self.m2 = float(np.square(values - self.mean).sum()) if self.count else 0.0
+        self.sorted_values = np.sort(values).tolist()
+        # Readings per GlucoseAnalyzer.STATUS_TABLE bucket
+        self.buckets = np.bincount(GlucoseAnalyzer.analyze_array(values), minlength=5).tolist()
+    
+    def add(self, value):
+        """Fold a single new reading into the statistics"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        insort(self.sorted_values, value)
+        self.buckets[GlucoseAnalyzer.bucket(value)] += 1
+    
+    def stats(self):
+        """Return the current statistics, or None when there are no readings"""
+        if not self.count:
+            return None
+        
+        half = self.count // 2
+        if self.count % 2:
+            median = self.sorted_values[half]
+        else:
+            median = (self.sorted_values[half - 1] + self.sorted_values[half]) / 2
+        
+        critical_low, warning_low, normal_count, warning_high, critical_high = self.buckets
+        stats = {
+            'count': self.count,
+            'average': self.mean,
+            'median': median,
+            'std_dev': math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0,
+            'min': self.sorted_values[0],
+            'max': self.sorted_values[-1],
+            'range': self.sorted_values[-1] - self.sorted_values[0],
+            'time_in_range': (normal_count / self.count) * 100,
+            'estimated_a1c': round((self.mean + 46.7) / 28.7, 1),
+            'critical_low': critical_low,
+            'warning_low': warning_low,
+            'normal': normal_count,
+            'warning_high': warning_high,
+            'critical_high': critical_high
+        }
+        return stats
+
+
+class ReadingHistory:
+    """
+    Columnar (structure-of-arrays) store for the readings shown in the history
+    
+    Each field lives in its own preallocated NumPy array that doubles in
+    capacity when full. Status and condition strings are kept as small integer
+    codes (status codes index GlucoseAnalyzer.STATUS_TABLE).
+    """
+    
+    STATUS_INDEX = {entry['status']: i for i, entry in enumerate(GlucoseAnalyzer.STATUS_TABLE)}
+    
+    def __init__(self, capacity=1024):
+        self.size = 0
+        self._timestamps = np.empty(capacity, dtype='datetime64[s]')
+        self._values = np.empty(capacity, dtype=np.float64)
+        self._status_idx = np.empty(capacity, dtype=np.int8)
+        self._condition_idx = np.empty(capacity, dtype=np.int8)
+        self.conditions = []
+        self._condition_codes = {}
+    
+    def __len__(self):
+        return self.size
+    
+    @property
+    def timestamps(self):
+        return self._timestamps[:self.size]
+    
+    @property
+    def values(self):
+        return self._values[:self.size]
+    
+    @property
+    def status_idx(self):
+        return self._status_idx[:self.size]
+    
+    @property
+    def condition_idx(self):
+        return self._condition_idx[:self.size]
+    
+    def _condition_code(self, condition):
+        """Return the integer code for a condition string, registering new ones"""
+        code = self._condition_codes.get(condition)
+        if code is None:
+            code = self._condition_codes[condition] = len(self.conditions)
+            self.conditions.append(condition)
+        return code
+    
+    def _reserve(self, count):
+        """Grow every column (by doubling) so that count more rows fit"""
+        needed = self.size + count
+        capacity = len(self._values)
+        if needed <= capacity:
+            return
+        
+        while capacity < needed:
+            capacity *= 2
+        for name in ('_timestamps', '_values', '_status_idx', '_condition_idx'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+    
+    def append(self, timestamp, value, status, condition):
+        """Append one reading ("%Y-%m-%d %H:%M:%S" timestamp, status string)"""
+        self._reserve(1)
+        i = self.size
+        self._timestamps[i] = np.datetime64(timestamp, 's')
+        self._values[i] = value
+        self._status_idx[i] = self.STATUS_INDEX[status]
+        self._condition_idx[i] = self._condition_code(condition)
+        self.size += 1
+    
+    def extend_rows(self, readings):
+        """Bulk-append database reading rows, preserving their order"""
+        count = len(readings)
+        self._reserve(count)
+        self._fill_rows(self.size, readings)
+        self.size += count
+    
+    def prepend_rows(self, readings):
+        """Bulk-insert database reading rows (older than all stored ones) at the front"""
+        count = len(readings)
+        self._reserve(count)
+        for column in (self._timestamps, self._values, self._status_idx, self._condition_idx):
+            column[count:count + self.size] = column[:self.size]
+        self._fill_rows(0, readings)
+        self.size += count
+    
+    def _fill_rows(self, start, readings):
+        """Write database reading rows into the columns from index start on"""
+        count = len(readings)
+        end = start + count
+        
+        self._timestamps[start:end] = np.array(list(map(_get_timestamp, readings)), dtype='datetime64[s]')
+        values = np.fromiter(map(_get_glucose_value, readings), dtype=np.float64, count=count)
+        self._values[start:end] = values
+        self._status_idx[start:end] = np.fromiter(
+            map(self.STATUS_INDEX.__getitem__, map(_get_status, readings)), dtype=np.int8, count=count)
+        self._condition_idx[start:end] = np.fromiter(
+            map(self._condition_code, map(_get_condition, readings)), dtype=np.int8, count=count)
+    
+    def clear(self):
+        """Drop all readings, keeping the allocated capacity"""
+        self.size = 0
+
+
+class HistoryModel(QAbstractTableModel):
+    """
+    Read-only table model presenting a ReadingHistory to a QTableView
+    Cells are formatted on demand, so only visible rows cost anything
+    """
+    
+    HEADERS = ("Timestamp", "Glucose (mg/dL)", "Status", "Condition")
+    
+    def __init__(self, history, parent=None):
+        super().__init__(parent)
+        self.history = history
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.history)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row, col = index.row(), index.column()
+        
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return str(self.history.timestamps[row]).replace('T', ' ')
+            if col == 1:
+                return f"{self.history.values[row]:.1f}"
+            if col == 2:
+                return GlucoseAnalyzer.STATUS_TABLE[self.history.status_idx[row]]['status']
+            return self.history.conditions[self.history.condition_idx[row]]
+        
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        
+        # Color-code status column
+        if col == 2:
+            if role == Qt.ForegroundRole:
+                return cached_color(GlucoseAnalyzer.STATUS_TABLE[self.history.status_idx[row]]['color'])
+            if role == Qt.FontRole:
+                return cached_font(10, QFont.Bold)
+        
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def append(self, timestamp, value, status, condition):
+        """Append one reading as a new row at the bottom"""
+        row = len(self.history)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.history.append(timestamp, value, status, condition)
+        self.endInsertRows()
+        
+    def prepend_rows(self, readings):
+        """Insert older database reading rows (oldest first) above the current ones"""
+        if not readings:
+            return
+        self.beginInsertRows(QModelIndex(), 0, len(readings) - 1)
+        self.history.prepend_rows(readings)
+        self.endInsertRows()
+        
+    def load_rows(self, readings):
+        """Replace all rows with database reading rows (oldest first)"""
+        self.beginResetModel()
+        self.history.clear()
+        self.history.extend_rows(readings)
+        self.endResetModel()
+        
+    def clear(self):
+        """Remove all rows"""
+        self.beginResetModel()
+        self.history.clear()
+        self.endResetModel()
+
+
+# Display text and completed fraction of one goal card, formatted once per goal
+GoalCard = namedtuple('GoalCard', 'title progress_text period fraction percent achieved')
+
+
+class GoalsModel(QAbstractListModel):
+    """
+    Read-only list model of a patient's goal rows for a QListView
+    Rows are painted by GoalDelegate, so no widgets are built per goal
+    """
+    
+    # Roles read by GoalDelegate
+    GOAL_ROLE = Qt.UserRole
+    CARD_ROLE = Qt.UserRole + 1
+    
+    # Card line templates, filled in one format_map pass per goal
+    TITLE_TEMPLATE = "🎯 {type}"
+    PROGRESS_TEMPLATE = "Target: {target:.1f} | Current: {current:.1f}"
+    PERIOD_TEMPLATE = "Period: {start} to {end}"
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # goal: (id, patient_id, goal_type, target_value, current_value, start_date, end_date, achieved)
+        self.goals = []
+        self.cards = []  # GoalCard per goal, built once per row
+        
+    @staticmethod
+    def goal_progress(goal):
+        """Fraction of a goal's target reached, clamped to 0..1"""
+        target, current = int(goal[3]), int(goal[4])
+        if target <= 0:
+            return 0.0
+        return min(max(current, 0), target) / target
+    
+    @classmethod
+    def goal_card(cls, goal):
+        """Pre-format the text a GoalDelegate paints for a goal row"""
+        fields = {'type': goal[2], 'target': goal[3], 'current': goal[4],
+                  'start': goal[5], 'end': goal[6]}
+        fraction = cls.goal_progress(goal)
+        return GoalCard(cls.TITLE_TEMPLATE.format_map(fields),
+                        cls.PROGRESS_TEMPLATE.format_map(fields),
+                        cls.PERIOD_TEMPLATE.format_map(fields),
+                        fraction, f"{int(fraction * 100)}%", bool(goal[7]))
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.goals)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        row = index.row()
+        goal = self.goals[row]
+        if role == self.GOAL_ROLE:
+            return goal
+        if role == self.CARD_ROLE:
+            return self.cards[row]
+        if role == Qt.DisplayRole:
+            return goal[2]
+        return None
+    
+    def set_goals(self, goals):
+        """Replace all rows with database goal rows"""
+        self.beginResetModel()
+        self.goals = list(goals)
+        self.cards = [self.goal_card(goal) for goal in self.goals]
+        self.endResetModel()
+        
+    def append(self, goal):
+        """Append one database goal row at the bottom"""
+        row = len(self.goals)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.goals.append(goal)
+        self.cards.append(self.goal_card(goal))
+        self.endInsertRows()
+
+
+class GoalDelegate(QStyledItemDelegate):
+    """
+    Paints a GoalsModel row as a goal card: title, progress, progress bar,
+    period and achievement status
+    """
+    
+    MARGIN = 4       # Gap around each card
+    PADDING = 18     # Card border to content
+    SPACING = 10     # Between lines of a card
+    BAR_HEIGHT = 30
+    
+    # Card colors for the dark (True) and light (False) themes
+    THEME_COLORS = {
+        True: {'card': '#2b2b2b', 'border': '#444', 'text': '#ffffff',
+               'bar': '#333', 'bar_border': '#444', 'chunk': '#00D4FF'},
+        False: {'card': '#ffffff', 'border': '#ddd', 'text': '#333333',
+                'bar': '#ffffff', 'bar_border': '#bbb', 'chunk': '#007acc'},
+    }
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.dark_mode = True
+        
+        # Shared fonts and line heights, looked up once for every card
+        self.title_font = cached_font(12, QFont.Bold)
+        self.body_font = cached_font(10)
+        self.dates_font = cached_font(9)
+        self.achieved_font = cached_font(10, QFont.Bold)
+        self._title_height = QFontMetrics(self.title_font).height()
+        self._body_height = QFontMetrics(self.body_font).height()
+        self._dates_height = QFontMetrics(self.dates_font).height()
+        self._achieved_height = QFontMetrics(self.achieved_font).height()
+        
+    def sizeHint(self, option, index):
+        card = index.data(GoalsModel.CARD_ROLE)
+        height = (self._title_height + self._body_height + self.BAR_HEIGHT + self._dates_height
+                  + 3 * self.SPACING + 2 * (self.PADDING + self.MARGIN))
+        if card.achieved:
+            height += self.SPACING + self._achieved_height
+        return QSize(option.rect.width(), height)
+    
+    def paint(self, painter, option, index):
+        goal_card = index.data(GoalsModel.CARD_ROLE)
+        colors = self.THEME_COLORS[self.dark_mode]
+        
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        
+        # Card background
+        card = option.rect.adjusted(self.MARGIN, self.MARGIN, -self.MARGIN, -self.MARGIN)
+        painter.setPen(QPen(cached_color(colors['border']), 1))
+        painter.setBrush(cached_color(colors['card']))
+        painter.drawRoundedRect(QRectF(card).adjusted(0.5, 0.5, -0.5, -0.5), 8, 8)
+        
+        x = card.left() + self.PADDING
+        width = card.width() - 2 * self.PADDING
+        y = card.top() + self.PADDING
+        
+        # Goal title
+        y = self._draw_text(painter, QRect(x, y, width, self._title_height),
+                            self.title_font, colors['text'], goal_card.title)
+        
+        # Progress
+        y = self._draw_text(painter, QRect(x, y, width, self._body_height),
+                            self.body_font, colors['text'], goal_card.progress_text)
+        
+        # Progress bar
+        self._draw_progress(painter, QRect(x, y, width, self.BAR_HEIGHT),
+                            goal_card.fraction, goal_card.percent, colors)
+        y += self.BAR_HEIGHT + self.SPACING
+        
+        # Dates
+        y = self._draw_text(painter, QRect(x, y, width, self._dates_height),
+                            self.dates_font, '#888', goal_card.period)
+        
+        # Achievement status
+        if goal_card.achieved:
+            self._draw_text(painter, QRect(x, y, width, self._achieved_height),
+                            self.achieved_font, '#4CAF50', "✓ Achieved!")
+        
+        painter.restore()
+        
+    def _draw_text(self, painter, rect, font, color, text):
+        """Draw one left-aligned line of a card, returning the next line's y"""
+        painter.setFont(font)
+        painter.setPen(cached_color(color))
+        painter.drawText(rect, Qt.AlignLeft | Qt.AlignVCenter, text)
+        return rect.bottom() + 1 + self.SPACING
+    
+    def _draw_progress(self, painter, rect, fraction, percent, colors):
+        """Draw a progress bar filled to fraction (0..1), labelled with percent"""
+        painter.setPen(QPen(cached_color(colors['bar_border']), 2))
+        painter.setBrush(cached_color(colors['bar']))
+        painter.drawRoundedRect(QRectF(rect).adjusted(1, 1, -1, -1), 5, 5)
+        
+        if fraction > 0:
+            chunk = QRectF(rect).adjusted(2, 2, -2, -2)
+            chunk.setWidth(chunk.width() * fraction)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(cached_color(colors['chunk']))
+            painter.drawRoundedRect(chunk, 3, 3)
+        
+        painter.setFont(self.body_font)
+        painter.setPen(cached_color(colors['text']))
+        painter.drawText(rect, Qt.AlignCenter, percent)
+
+
+class BlittedPlotWidget(QWidget):
+    """
+    Matplotlib canvas whose data artists are blitted over a cached background
+    
+    Subclasses create animated data artists in _setup_static, draw them in
+    _draw_dynamic and describe the static scene in _current_view. After
+    changing data they call _blit, which repaints only the data artists while
+    the cached background still matches the view, and otherwise schedules a
+    full redraw that re-grabs it.
     """
     
     def __init__(self, parent=None):
@@ -337,21 +1036,80 @@ class TrendPlotWidget(QWidget):
         self.canvas = FigureCanvas(self.figure)
         self.ax = self.figure.add_subplot(111)
         
-        # Data storage
-        self.glucose_values = []
-        self.timestamps = []
-        self.max_points = 20  # Show last 20 readings
+        # Blitting state: (view, bitmap) of the static scene per background key
+        self._backgrounds = {}
+        self.canvas.mpl_connect('draw_event', self._on_draw)
         
         # Layout
         layout = QVBoxLayout()
         layout.addWidget(self.canvas)
         self.setLayout(layout)
         
+    def _background_key(self):
+        """Key of the cached background matching the current static scene"""
+        return None
+        
+    def _blit_bbox(self):
+        """Region of the canvas that is cached and blitted"""
+        return self.ax.bbox
+        
+    def _current_view(self):
+        """State of the static scene that the cached background depends on"""
+        return self.ax.get_xlim(), self.ax.get_ylim()
+        
+    def _draw_dynamic(self):
+        """Draw the animated data artists onto the canvas"""
+        raise NotImplementedError
+        
+    def _blit(self):
+        """Repaint the data artists, blitting when the static scene is cached"""
+        cached = self._backgrounds.get(self._background_key())
+        if cached is not None and cached[0] == self._current_view():
+            # Static scene unchanged - only repaint the data artists
+            self.canvas.restore_region(cached[1])
+            self._draw_dynamic()
+            self.canvas.blit(self._blit_bbox())
+        else:
+            # Limits/size changed - full redraw, _on_draw re-grabs the background
+            self.canvas.draw_idle()
+        
+    def _on_draw(self, event):
+        """Cache the freshly rendered static scene, then overlay the data"""
+        self._backgrounds[self._background_key()] = (self._current_view(),
+                                                     self.canvas.copy_from_bbox(self._blit_bbox()))
+        self._draw_dynamic()
+
+
+class TrendPlotWidget(BlittedPlotWidget):
+    """
+    Custom widget for plotting glucose trends using matplotlib
+    Embedded matplotlib canvas in PyQt5
+    """
+    
+    # RGBA point colors indexed by status: critical, warning, normal
+    POINT_COLORS = np.array([to_rgba('#FF4444'), to_rgba('#FFA500'), to_rgba('#4CAF50')])
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        # Data storage - the last N readings live in _buffer[_start:_end]; the
+        # buffer holds twice that so the window only has to be compacted back
+        # to the front once every N appends
+        self.max_points = 20  # Show last 20 readings
+        self._buffer = np.empty(2 * self.max_points, dtype=np.float64)
+        self._start = self._end = 0
+        self.reading_count = 0
+        
+        # Coalesces bursts of readings into one redraw (at most every 50 ms)
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.timeout.connect(self._do_update_plot)
+        
         # Initial plot setup
-        self.setup_plot()
+        self._setup_static()
         
-    def setup_plot(self):
-        """Configure plot appearance"""
+    def _setup_static(self):
+        """Configure plot appearance and create the data artists (called once)"""
         self.ax.set_facecolor('#1e1e1e')
         self.ax.set_xlabel('Reading Number', color='white', fontsize=10)
         self.ax.set_ylabel('Glucose (mg/dL)', color='white', fontsize=10)
@@ -369,57 +1127,717 @@ class TrendPlotWidget(QWidget):
         self.ax.spines['left'].set_color('white')
         self.ax.spines['right'].set_color('white')
         
+        # Persistent data artists - updated in place by _do_update_plot and
+        # animated so they are blitted over the cached background
+        self._line, = self.ax.plot([], [], 'o-', color='#00D4FF', linewidth=2,
+                                   markersize=6, label='Glucose Level', animated=True)
+        self._scatter = self.ax.scatter([], [], s=64, zorder=5, animated=True)
+        self._legend = self.ax.legend(loc='upper left', fontsize=8, facecolor='#2b2b2b',
+                                      edgecolor='white', labelcolor='white')
+        self._legend.set_visible(False)
+        
+    @property
+    def glucose_values(self):
+        """View of the plotted glucose values, oldest first"""
+        return self._buffer[self._start:self._end]
+    
+    @property
+    def timestamps(self):
+        """Reading numbers of the plotted values"""
+        return np.arange(self.reading_count - (self._end - self._start) + 1, self.reading_count + 1)
+        
     def add_reading(self, glucose_value):
         """Add a new glucose reading to the plot"""
-        self.glucose_values.append(glucose_value)
-        self.timestamps.append(len(self.glucose_values))
+        if self._end == len(self._buffer):
+            # Buffer exhausted - move the newest max_points - 1 values to the front
+            keep = self.max_points - 1
+            self._buffer[:keep] = self._buffer[self._end - keep:self._end]
+            self._start, self._end = 0, keep
+        
+        self._buffer[self._end] = glucose_value
+        self._end += 1
+        # Oldest point is evicted once max_points is reached
+        if self._end - self._start > self.max_points:
+            self._start += 1
+        self.reading_count += 1
+        
+        self.update_plot()
+        
+    def set_series(self, values, total=None):
+        """
+        Replace all readings with a sequence of glucose values (oldest first)
         
-        # Keep only last N points
-        if len(self.glucose_values) > self.max_points:
-            self.glucose_values.pop(0)
-            self.timestamps.pop(0)
+        total is the number of readings values ends with, when values is only
+        the newest part of the history, so reading numbers stay absolute
+        """
+        self.reading_count = len(values) if total is None else total
+        recent = np.asarray(values, dtype=np.float64)[-self.max_points:]
+        self._buffer[:len(recent)] = recent
+        self._start, self._end = 0, len(recent)
         
         self.update_plot()
         
     def update_plot(self):
-        """Redraw the plot with current data"""
-        self.ax.clear()
-        self.setup_plot()
-        
-        if self.glucose_values:
-            # Plot line
-            line = self.ax.plot(self.timestamps, self.glucose_values, 
-                               'o-', color='#00D4FF', linewidth=2, 
-                               markersize=6, label='Glucose Level')
-            
-            # Color-code points based on status
-            for i, val in enumerate(self.glucose_values):
-                if val < 50 or val > 180:
-                    color = '#FF4444'
-                elif val < 70 or val > 140:
-                    color = '#FFA500'
-                else:
-                    color = '#4CAF50'
-                self.ax.plot(self.timestamps[i], val, 'o', 
-                           color=color, markersize=8, zorder=5)
-            
-            # Adjust y-axis limits
-            y_min = min(self.glucose_values) - 20
-            y_max = max(self.glucose_values) + 20
+        """Schedule a redraw, merging it with any redraw already pending"""
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start(50)
+        
+    def _do_update_plot(self):
+        """Refresh the persistent line/scatter artists with current data"""
+        values = self.glucose_values
+        x = self.timestamps
+        self._line.set_data(x, values)
+        
+        if values.size:
+            # Color-code points based on status (0 = critical, 1 = warning, 2 = normal)
+            status_idx = np.where((values < 50) | (values > 180), 0,
+                                  np.where((values < 70) | (values > 140), 1, 2))
+            self._scatter.set_offsets(np.column_stack((x, values)))
+            self._scatter.set_facecolors(self.POINT_COLORS[status_idx])
+            
+            # Adjust axis limits - a fixed-width x window and y limits snapped to
+            # 20 mg/dL steps keep the view (and cached background) stable
+            first = x[0]
+            self.ax.set_xlim(first - 0.5, first + self.max_points - 0.5)
+            y_min = math.floor((values.min() - 20) / 20) * 20
+            y_max = math.ceil((values.max() + 20) / 20) * 20
             self.ax.set_ylim(max(0, y_min), y_max)
-            
-            self.ax.legend(loc='upper left', fontsize=8, facecolor='#2b2b2b', 
-                          edgecolor='white', labelcolor='white')
+        else:
+            self._scatter.set_offsets(np.empty((0, 2)))
+        
+        self._legend.set_visible(bool(values.size))
+        self._blit()
         
-        self.canvas.draw()
+    def _current_view(self):
+        """Limits plus legend visibility, which is part of the static scene"""
+        return super()._current_view() + (self._legend.get_visible(),)
+        
+    def _draw_dynamic(self):
+        """Draw the line and scatter data artists"""
+        self.ax.draw_artist(self._line)
+        self.ax.draw_artist(self._scatter)
         
     def clear_plot(self):
         """Clear all data and reset the plot"""
-        self.glucose_values.clear()
-        self.timestamps.clear()
-        self.ax.clear()
-        self.setup_plot()
-        self.canvas.draw()
+        self._start = self._end = 0
+        self.reading_count = 0
+        self._redraw_timer.stop()
+        self.reset_dynamic()
+        
+    def reset_dynamic(self):
+        """Empty the data artists, leaving the static decorations in place"""
+        self._line.set_data([], [])
+        self._scatter.set_offsets(np.empty((0, 2)))
+        self._legend.set_visible(False)
+        self.canvas.draw_idle()
+
+
+class DistributionPlotWidget(BlittedPlotWidget):
+    """
+    Histogram / box plot of glucose readings for the Advanced Graphs tab
+    The data artists are created once and blitted over a cached background
+    """
+    
+    HIST_BINS = 20
+    
+    # Title, x label and y label for each plot mode
+    MODE_LABELS = {
+        'hist': ('Glucose Distribution', 'Glucose (mg/dL)', 'Frequency'),
+        'box': ('Glucose Variability', '', 'Glucose (mg/dL)'),
+        'empty': ('', '', ''),
+    }
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.mode = 'empty'
+        
+        # Initial plot setup
+        self._setup_static()
+        
+    def _setup_static(self):
+        """Configure plot appearance and create the data artists (called once)"""
+        self.ax.set_facecolor('#1e1e1e')
+        self.ax.tick_params(colors='white')
+        
+        # Title/label text objects are styled once; mode switches only swap their text
+        self.ax.title.set_color('white')
+        self.ax.title.set_fontweight('bold')
+        self.ax.xaxis.label.set_color('white')
+        self.ax.yaxis.label.set_color('white')
+        self._auto_locator = AutoLocator()
+        self._box_locator = FixedLocator([1])
+        
+        # Persistent data artists - resized in place and animated so they are
+        # blitted over the cached background
+        zeros = np.zeros(self.HIST_BINS)
+        self._bars = self.ax.bar(zeros, zeros, width=0, align='edge', color='#00D4FF',
+                                 edgecolor='white', alpha=0.7, animated=True, visible=False)
+        self._box = self.ax.boxplot([[0.0]], vert=True, patch_artist=True, manage_ticks=False)
+        self._box['boxes'][0].set_facecolor('#00D4FF')
+        self._box_artists = [artist for artists in self._box.values() for artist in artists]
+        for artist in self._box_artists:
+            artist.set_animated(True)
+            artist.set_visible(False)
+        
+    @classmethod
+    def summarize(cls, mode, values):
+        """
+        Reduce glucose values to what a plot mode draws: (counts, edges) for
+        'hist', the boxplot statistics dict for 'box'. Touches no Qt or
+        Matplotlib objects, so it may run off the GUI thread
+        """
+        if mode == 'hist':
+            return np.histogram(values, bins=cls.HIST_BINS)
+        return boxplot_stats(values)[0]
+        
+    def show_histogram(self, counts, edges):
+        """Plot histogram counts over HIST_BINS bins (see summarize)"""
+        for bar, left, width, height in zip(self._bars, edges[:-1], np.diff(edges), counts):
+            bar.set_x(left)
+            bar.set_width(width)
+            bar.set_height(height)
+        
+        # Limits snapped to 20 mg/dL / 5 reading steps keep the view (and cached
+        # background) stable while the data changes
+        x_min = math.floor(edges[0] / 20) * 20
+        x_max = math.ceil(edges[-1] / 20) * 20
+        y_max = max(5, math.ceil(counts.max() * 1.05 / 5) * 5)
+        self._show('hist', (x_min, x_max), (0, y_max))
+        
+    def show_boxplot(self, stats):
+        """Plot boxplot statistics as a single box (see summarize)"""
+        q1, q3 = stats['q1'], stats['q3']
+        box = self._box['boxes'][0].get_path().vertices
+        box[:, 1] = [q1, q1, q3, q3, q1, q1]
+        low_whisker, high_whisker = self._box['whiskers']
+        low_whisker.set_ydata([q1, stats['whislo']])
+        high_whisker.set_ydata([q3, stats['whishi']])
+        low_cap, high_cap = self._box['caps']
+        low_cap.set_ydata([stats['whislo']] * 2)
+        high_cap.set_ydata([stats['whishi']] * 2)
+        self._box['medians'][0].set_ydata([stats['med']] * 2)
+        fliers = stats['fliers']
+        self._box['fliers'][0].set_data(np.ones(len(fliers)), fliers)
+        
+        y_min = min(stats['whislo'], fliers.min(initial=stats['whislo']))
+        y_max = max(stats['whishi'], fliers.max(initial=stats['whishi']))
+        self._show('box', (0.5, 1.5),
+                   (max(0, math.floor((y_min - 10) / 20) * 20), math.ceil((y_max + 10) / 20) * 20))
+        
+    def show_empty(self):
+        """Blank plot for graph types without a renderer"""
+        self._show('empty', (0, 1), (0, 1))
+        
+    def _show(self, mode, xlim, ylim):
+        """Switch to a plot mode and repaint, blitting when the static scene is cached"""
+        if mode != self.mode:
+            self.mode = mode
+            title, xlabel, ylabel = self.MODE_LABELS[mode]
+            self.ax.title.set_text(title)
+            self.ax.xaxis.label.set_text(xlabel)
+            self.ax.yaxis.label.set_text(ylabel)
+            self.ax.xaxis.set_major_locator(self._box_locator if mode == 'box' else self._auto_locator)
+            for bar in self._bars:
+                bar.set_visible(mode == 'hist')
+            for artist in self._box_artists:
+                artist.set_visible(mode == 'box')
+        if self.ax.get_xlim() != xlim:
+            self.ax.set_xlim(xlim)
+        if self.ax.get_ylim() != ylim:
+            self.ax.set_ylim(ylim)
+        self._blit()
+        
+    def _background_key(self):
+        """One cached background per mode, since titles/ticks differ between them"""
+        return self.mode
+        
+    def _blit_bbox(self):
+        """The whole figure, so the per-mode title and labels are cached too"""
+        return self.figure.bbox
+        
+    def _current_view(self):
+        """Limits plus figure size, as backgrounds of other modes outlive a resize"""
+        return super()._current_view() + (tuple(self.figure.bbox.bounds),)
+        
+    def _draw_dynamic(self):
+        """Draw the data artists of the current mode onto the canvas"""
+        if self.mode == 'hist':
+            for bar in self._bars:
+                self.ax.draw_artist(bar)
+        elif self.mode == 'box':
+            for artist in self._box_artists:
+                self.ax.draw_artist(artist)
+
+
+# Stylesheets applied by MainWindow, built once at import instead of per call
+
+# Message boxes (alerts, confirmations)
+_MSGBOX_QSS = """
+    QMessageBox {
+        background-color: #2b2b2b;
+        color: white;
+    }
+    QMessageBox QLabel {
+        color: white;
+    }
+    QMessageBox QPushButton {
+        background-color: #00D4FF;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 8px 20px;
+        min-width: 80px;
+    }
+    QMessageBox QPushButton:hover {
+        background-color: #00B8E6;
+    }
+"""
+
+# Add-patient dialog
+_PATIENT_DIALOG_QSS = """
+    QDialog {
+        background-color: #1e1e1e;
+        color: white;
+    }
+    QLabel {
+        color: white;
+        font-size: 11pt;
+    }
+    QLineEdit, QSpinBox, QComboBox {
+        background-color: #333;
+        color: white;
+        border: 2px solid #444;
+        border-radius: 5px;
+        padding: 8px;
+        font-size: 10pt;
+    }
+    QLineEdit:focus, QSpinBox:focus, QComboBox:focus {
+        border: 2px solid #00D4FF;
+    }
+    QPushButton {
+        background-color: #00D4FF;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 10px 20px;
+        font-size: 11pt;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #00B8E6;
+    }
+    QPushButton:pressed {
+        background-color: #0099CC;
+    }
+    QComboBox::drop-down {
+        border: none;
+        padding-right: 10px;
+    }
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 5px solid white;
+        margin-right: 5px;
+    }
+    QComboBox QAbstractItemView {
+        background-color: #333;
+        color: white;
+        selection-background-color: #00D4FF;
+        border: 1px solid #444;
+    }
+"""
+
+# Export dialog
+_EXPORT_DIALOG_QSS = """
+    QDialog {
+        background-color: #1e1e1e;
+        color: white;
+    }
+    QLabel {
+        color: white;
+        font-size: 11pt;
+    }
+    QPushButton {
+        background-color: #00D4FF;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 12px 20px;
+        font-size: 12pt;
+        font-weight: bold;
+        min-width: 100px;
+    }
+    QPushButton:hover {
+        background-color: #00B8E6;
+    }
+    QPushButton:pressed {
+        background-color: #0099CC;
+    }
+"""
+
+# Dark theme (default), applied to the whole application
+_DARK_THEME_QSS = """
+    QMainWindow {
+        background-color: #1e1e1e;
+    }
+    
+    QFrame#headerFrame {
+        background-color: #252525;
+        border-radius: 10px;
+        padding: 15px;
+    }
+    
+    QFrame#inputPanel, QFrame#statusPanel, QFrame#graphPanel, QFrame#historyPanel {
+        background-color: #252525;
+        border-radius: 10px;
+        padding: 15px;
+        border: 1px solid #333;
+    }
+    
+    QFrame#infoFrame, QFrame#statCard {
+        background-color: #2b2b2b;
+        border-radius: 8px;
+        padding: 10px;
+        border: 1px solid #444;
+    }
+    
+    QListView#goalsList {
+        background-color: transparent;
+        border: none;
+    }
+    
+    QTabWidget::pane {
+        border: 1px solid #333;
+        background-color: #1e1e1e;
+    }
+    
+    QTabBar::tab {
+        background-color: #252525;
+        color: white;
+        padding: 10px 20px;
+        border: 1px solid #333;
+        border-bottom: none;
+        border-top-left-radius: 5px;
+        border-top-right-radius: 5px;
+    }
+    
+    QTabBar::tab:selected {
+        background-color: #1e1e1e;
+        border-bottom: 3px solid #00D4FF;
+    }
+    
+    QTabBar::tab:hover {
+        background-color: #2b2b2b;
+    }
+    
+    QSpinBox, QDoubleSpinBox {
+        background-color: #333;
+        color: white;
+        border: 2px solid #444;
+        border-radius: 5px;
+        padding: 8px;
+    }
+    
+    QProgressBar {
+        border: 2px solid #444;
+        border-radius: 5px;
+        text-align: center;
+        background-color: #333;
+        color: white;
+    }
+    
+    QProgressBar::chunk {
+        background-color: #00D4FF;
+        border-radius: 3px;
+    }
+    
+    QLabel {
+        color: #ffffff;
+    }
+    
+    QLineEdit {
+        background-color: #333;
+        color: white;
+        border: 2px solid #444;
+        border-radius: 5px;
+        padding: 8px;
+        font-size: 12px;
+    }
+    
+    QLineEdit:focus {
+        border: 2px solid #00D4FF;
+    }
+    
+    QComboBox {
+        background-color: #333;
+        color: white;
+        border: 2px solid #444;
+        border-radius: 5px;
+        padding: 8px;
+        font-size: 11px;
+    }
+    
+    QComboBox:hover {
+        border: 2px solid #00D4FF;
+    }
+    
+    QComboBox::drop-down {
+        border: none;
+        width: 30px;
+    }
+    
+    QComboBox::down-arrow {
+        image: none;
+        border-left: 5px solid transparent;
+        border-right: 5px solid transparent;
+        border-top: 5px solid white;
+        margin-right: 10px;
+    }
+    
+    QComboBox QAbstractItemView {
+        background-color: #333;
+        color: white;
+        selection-background-color: #00D4FF;
+        border: 1px solid #444;
+    }
+    
+    QPushButton {
+        background-color: #00D4FF;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 10px;
+        font-weight: bold;
+    }
+    
+    QPushButton:hover {
+        background-color: #00B8E6;
+    }
+    
+    QPushButton:pressed {
+        background-color: #0099CC;
+    }
+    
+    QTableView {
+        background-color: #2b2b2b;
+        color: white;
+        gridline-color: #444;
+        border: 1px solid #444;
+        border-radius: 5px;
+        alternate-background-color: #2b2b2b;
+    }
+    
+    QTableView::item {
+        padding: 8px;
+        background-color: #2b2b2b;
+    }
+    
+    QTableView::item:alternate {
+        background-color: #252525;
+    }
+    
+    QTableView::item:selected {
+        background-color: #00D4FF;
+        color: white;
+    }
+    
+    QHeaderView::section {
+        background-color: #333;
+        color: white;
+        padding: 8px;
+        border: 1px solid #444;
+        font-weight: bold;
+    }
+    
+    QScrollBar:vertical {
+        background-color: #2b2b2b;
+        width: 12px;
+        border-radius: 6px;
+    }
+    
+    QScrollBar::handle:vertical {
+        background-color: #555;
+        border-radius: 6px;
+        min-height: 20px;
+    }
+    
+    QScrollBar::handle:vertical:hover {
+        background-color: #666;
+    }
+    
+    QScrollBar:horizontal {
+        background-color: #2b2b2b;
+        height: 12px;
+        border-radius: 6px;
+    }
+    
+    QScrollBar::handle:horizontal {
+        background-color: #555;
+        border-radius: 6px;
+        min-width: 20px;
+    }
+    
+    QScrollBar::handle:horizontal:hover {
+        background-color: #666;
+    }
+"""
+
+# Light theme
+_LIGHT_THEME_QSS = """
+    QMainWindow { background-color: #f5f5f5; }
+    QFrame#headerFrame { background-color: #ffffff; border: 1px solid #ddd; border-radius: 10px; padding: 15px; }
+    QFrame#inputPanel, QFrame#statusPanel, QFrame#graphPanel, QFrame#historyPanel, QFrame#statCard {
+        background-color: #ffffff; border: 1px solid #ddd; border-radius: 10px; padding: 15px;
+    }
+    QLabel { color: #333; }
+    QLineEdit, QComboBox, QSpinBox { background-color: #fff; color: #333; border: 2px solid #ccc; border-radius: 5px; padding: 8px; }
+    QPushButton { background-color: #007acc; color: white; border: none; border-radius: 5px; padding: 10px; }
+    QPushButton:hover { background-color: #005a9e; }
+    QTableView { background-color: #fff; color: #333; gridline-color: #ddd; border: 1px solid #ddd; }
+    QHeaderView::section { background-color: #e0e0e0; color: #333; padding: 8px; border: 1px solid #ccc; }
+    QTabWidget::pane { border: 1px solid #ddd; background-color: #fff; }
+    QTabBar::tab { background-color: #e0e0e0; color: #333; padding: 10px 20px; border: 1px solid #ccc; }
+    QTabBar::tab:selected { background-color: #fff; border-bottom: 3px solid #007acc; }
+    QListView#goalsList { background-color: transparent; border: none; }
+"""
+
+# Status indicator before any reading
+_INDICATOR_IDLE_QSS = """
+    QFrame#statusIndicator {
+        background-color: #333;
+        border-radius: 10px;
+        border: 3px solid #555;
+    }
+"""
+
+# Status indicator while an alarm flashes
+_INDICATOR_FLASH_QSS = """
+    QFrame#statusIndicator {
+        background-color: #FF4444;
+        border-radius: 10px;
+        border: 5px solid #FFFF00;
+    }
+"""
+
+# Status indicator showing a reading, formatted once per status color
+_INDICATOR_QSS_TEMPLATE = """
+    QFrame#statusIndicator {{
+        background-color: {color};
+        border-radius: 10px;
+        border: 3px solid white;
+    }}
+"""
+_INDICATOR_QSS_CACHE = {}
+
+
+# Shared Qt font/color objects, built on first use (a QApplication must exist)
+_FONT_CACHE = {}
+_COLOR_CACHE = {}
+
+
+def write_tone_wav(path, frequency, duration_ms, gap_ms=0, sample_rate=22050):
+    """Write a mono 16-bit sine tone followed by optional silence to a WAV file"""
+    t = np.arange(int(sample_rate * duration_ms / 1000)) / sample_rate
+    tone = (np.sin(2 * np.pi * frequency * t) * 0.5 * 32767).astype('<i2')
+    silence = np.zeros(int(sample_rate * gap_ms / 1000), dtype='<i2')
+    
+    with wave.open(path, 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(np.concatenate((tone, silence)).tobytes())
+
+
+class BeepWorker(QRunnable):
+    """Plays the blocking winsound alarm beeps on a thread-pool thread"""
+    
+    def __init__(self, critical):
+        super().__init__()
+        self.critical = critical
+        
+    def run(self):
+        import winsound
+        try:
+            if self.critical:
+                # Critical condition: play 3 urgent beeps
+                for i in range(3):
+                    winsound.Beep(1200, 200)  # 1200 Hz for 200ms (urgent tone)
+                    if i < 2:  # Don't wait after last beep
+                        QThread.msleep(50)  # Short pause between beeps
+            else:
+                # Warning condition: play single beep
+                winsound.Beep(800, 300)  # 800 Hz for 300ms (warning tone)
+        except:
+            # If winsound fails, silently continue
+            pass
+
+
+class PlotSummarySignals(QObject):
+    """Signals for PlotSummaryWorker - a QRunnable cannot carry signals itself"""
+    
+    finished = pyqtSignal(int, str, object)  # request id, plot mode, summary
+    
+
+class PlotSummaryWorker(QRunnable):
+    """Bins/summarizes advanced graph values on a thread-pool thread"""
+    
+    def __init__(self, signals, request_id, mode, values):
+        super().__init__()
+        self.signals = signals
+        self.request_id = request_id
+        self.mode = mode
+        self.values = values
+        
+    def run(self):
+        summary = DistributionPlotWidget.summarize(self.mode, self.values)
+        self.signals.finished.emit(self.request_id, self.mode, summary)
+
+
+class ExportThread(QThread):
+    """Runs a blocking export function off the UI thread and reports the outcome"""
+    
+    succeeded = pyqtSignal(str)
+    failed = pyqtSignal(str)
+    
+    def __init__(self, export_func, readings, file_path, parent=None):
+        super().__init__(parent)
+        self.export_func = export_func
+        self.readings = readings
+        self.file_path = file_path
+        
+    def run(self):
+        try:
+            self.export_func(self.readings, self.file_path)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.succeeded.emit(self.file_path)
+
+
+def cached_font(size, weight=QFont.Normal):
+    """Return the shared "Segoe UI" QFont for the given point size and weight"""
+    key = (size, weight)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = QFont("Segoe UI", size, weight)
+    return font
+
+
+def indicator_stylesheet(color):
+    """Return the status indicator stylesheet for a reading color"""
+    qss = _INDICATOR_QSS_CACHE.get(color)
+    if qss is None:
+        qss = _INDICATOR_QSS_CACHE[color] = _INDICATOR_QSS_TEMPLATE.format(color=color)
+    return qss
+
+
+def cached_color(color):
+    """Return the shared QColor for a color string such as '#FF4444'"""
+    qcolor = _COLOR_CACHE.get(color)
+    if qcolor is None:
+        qcolor = _COLOR_CACHE[color] = QColor(color)
+    return qcolor
 
 
 class MainWindow(QMainWindow):
@@ -428,6 +1846,13 @@ class MainWindow(QMainWindow):
     Coordinates all UI components and handles user interactions
     """
     
+    # Readings fetched per history page; older pages load when the history
+    # table is scrolled to the top
+    HISTORY_PAGE_SIZE = 500
+    
+    # Advanced graph types that DistributionPlotWidget can draw, by plot mode
+    ADVANCED_GRAPH_MODES = {"Distribution Histogram": 'hist', "Box Plot": 'box'}
+    
     def __init__(self):
         super().__init__()
         
@@ -437,7 +1862,21 @@ class MainWindow(QMainWindow):
         
         # Database and data management
         self.db = DatabaseManager()
-        self.history = []
+        self.history = ReadingHistory()
+        self.history_complete = True  # False while older readings remain unloaded
+        self.running_stats = None
+        self._running_stats_seeded_at = 0.0  # time.monotonic() of the last reseed
+        
+        # Statistics refreshes are debounced - a burst of requests within
+        # 150 ms collapses into one dashboard update (and at most one query)
+        self._stats_reload = False
+        self._stats_timer = QTimer(self)
+        self._stats_timer.setSingleShot(True)
+        self._stats_timer.timeout.connect(self._do_update_statistics)
+        
+        # Background PDF export in progress, if any
+        self.export_thread = None
+        self._add_goal_dialog = None  # Built on first use by show_add_goal_dialog
         
         # Patient management
         self.current_patient_id = None
@@ -450,6 +1889,8 @@ class MainWindow(QMainWindow):
         # Alarm state
         self.alarm_active = False
         self.flash_state = False
+        self._indicator_normal_qss = ""
+        self._last_status = None  # (status, color) currently shown in the status panel
         
         # Create UI
         self.init_ui()
@@ -461,6 +1902,9 @@ class MainWindow(QMainWindow):
         self.alarm_timer = QTimer()
         self.alarm_timer.timeout.connect(self.flash_alarm)
         
+        # Alarm sounds (played asynchronously by Qt's audio thread)
+        self.init_alarm_sounds()
+        
         # Load existing data (after UI is created)
         self.load_patient_data()
     
@@ -470,8 +1914,18 @@ class MainWindow(QMainWindow):
         if not patient:
             self.current_patient_id = self.db.add_patient("Default Patient", 30, "Normal")
         else:
-            self.current_patient_id = patient[0]
-        
+            self.current_patient_id = patient['id']
+
+    def closeEvent(self, event):
+        """Release the database connection when the window closes"""
+        self._stats_timer.stop()
+        if self.export_thread is not None:
+            self.export_thread.wait()
+        self.stop_alarm()
+        self.remove_alarm_sounds()
+        self.db.close()
+        super().closeEvent(event)
+
     def init_ui(self):
         """Initialize all UI components"""
         
@@ -488,7 +1942,7 @@ class MainWindow(QMainWindow):
         
         # Tab widget for different views
         self.tabs = QTabWidget()
-        self.tabs.setFont(QFont("Segoe UI", 10))
+        self.tabs.setFont(cached_font(10))
         
         # Tab 1: Main Monitor
         main_tab = QWidget()
@@ -518,20 +1972,27 @@ class MainWindow(QMainWindow):
         
         self.tabs.addTab(main_tab, "📊 Monitor")
         
-        # Tab 2: Statistics
-        stats_tab = self.create_statistics_tab()
-        self.tabs.addTab(stats_tab, "📈 Statistics")
-        
-        # Tab 3: Goals
-        goals_tab = self.create_goals_tab()
-        self.tabs.addTab(goals_tab, "🎯 Goals")
-        
-        # Tab 4: Advanced Graphs
-        graphs_tab = self.create_advanced_graphs_tab()
-        self.tabs.addTab(graphs_tab, "📉 Advanced Graphs")
+        # Remaining tabs start as empty placeholders and are built the first
+        # time they are selected (see materialize_tab)
+        self._tab_factories = {}
+        for title, factory in [
+            ("📈 Statistics", self.create_statistics_tab),         # Tab 2
+            ("🎯 Goals", self.create_goals_tab),                   # Tab 3
+            ("📉 Advanced Graphs", self.create_advanced_graphs_tab)  # Tab 4
+        ]:
+            placeholder = QWidget()
+            QVBoxLayout(placeholder).setContentsMargins(0, 0, 0, 0)
+            self._tab_factories[self.tabs.addTab(placeholder, title)] = factory
+        self.tabs.currentChanged.connect(self.materialize_tab)
         
         main_layout.addWidget(self.tabs)
         
+    def materialize_tab(self, index):
+        """Build a lazily created tab's contents the first time it is shown"""
+        factory = self._tab_factories.pop(index, None)
+        if factory is not None:
+            self.tabs.widget(index).layout().addWidget(factory())
+        
     def create_enhanced_header(self):
         """Create enhanced application header with controls"""
         header_frame = QFrame()
@@ -540,11 +2001,11 @@ class MainWindow(QMainWindow):
         
         # Title section
         title = QLabel("🏥 Glucometer Analyzer Pro")
-        title.setFont(QFont("Segoe UI", 22, QFont.Bold))
+        title.setFont(cached_font(22, QFont.Bold))
         title.setStyleSheet("color: #00D4FF;")
         
         subtitle = QLabel("Advanced Medical Device Monitoring")
-        subtitle.setFont(QFont("Segoe UI", 9))
+        subtitle.setFont(cached_font(9))
         subtitle.setStyleSheet("color: #888;")
         
         title_layout = QVBoxLayout()
@@ -556,11 +2017,11 @@ class MainWindow(QMainWindow):
         
         # Patient selector
         patient_label = QLabel("Patient:")
-        patient_label.setFont(QFont("Segoe UI", 10))
+        patient_label.setFont(cached_font(10))
         header_layout.addWidget(patient_label)
         
         self.patient_combo = QComboBox()
-        self.patient_combo.setFont(QFont("Segoe UI", 10))
+        self.patient_combo.setFont(cached_font(10))
         self.patient_combo.setMinimumWidth(150)
         self.patient_combo.currentTextChanged.connect(self.switch_patient)
         self.load_patients_combo()
@@ -568,21 +2029,21 @@ class MainWindow(QMainWindow):
         
         # Add patient button
         add_patient_btn = QPushButton("+ New Patient")
-        add_patient_btn.setFont(QFont("Segoe UI", 9))
+        add_patient_btn.setFont(cached_font(9))
         add_patient_btn.clicked.connect(self.show_add_patient_dialog)
         add_patient_btn.setFixedHeight(30)
         header_layout.addWidget(add_patient_btn)
         
         # Theme toggle
         self.theme_btn = QPushButton("☀️ Light Mode")
-        self.theme_btn.setFont(QFont("Segoe UI", 9))
+        self.theme_btn.setFont(cached_font(9))
         self.theme_btn.clicked.connect(self.toggle_theme)
         self.theme_btn.setFixedHeight(30)
         header_layout.addWidget(self.theme_btn)
         
         # Export button
         export_btn = QPushButton("📤 Export")
-        export_btn.setFont(QFont("Segoe UI", 9))
+        export_btn.setFont(cached_font(9))
         export_btn.clicked.connect(self.show_export_dialog)
         export_btn.setFixedHeight(30)
         header_layout.addWidget(export_btn)
@@ -602,36 +2063,36 @@ class MainWindow(QMainWindow):
         
         # Title
         title = QLabel("📊 Input Data")
-        title.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        title.setFont(cached_font(14, QFont.Bold))
         title.setStyleSheet("color: #00D4FF;")
         layout.addWidget(title)
         
         # Glucose input
         glucose_label = QLabel("Glucose Level (mg/dL):")
-        glucose_label.setFont(QFont("Segoe UI", 10))
+        glucose_label.setFont(cached_font(10))
         layout.addWidget(glucose_label)
         
         self.glucose_input = QLineEdit()
         self.glucose_input.setPlaceholderText("Enter value (e.g., 120)")
-        self.glucose_input.setFont(QFont("Segoe UI", 12))
+        self.glucose_input.setFont(cached_font(12))
         self.glucose_input.setFixedHeight(40)
         self.glucose_input.returnPressed.connect(self.analyze_glucose)
         layout.addWidget(self.glucose_input)
         
         # Patient condition dropdown
         condition_label = QLabel("Patient Condition:")
-        condition_label.setFont(QFont("Segoe UI", 10))
+        condition_label.setFont(cached_font(10))
         layout.addWidget(condition_label)
         
         self.condition_combo = QComboBox()
         self.condition_combo.addItems(["Normal", "Diabetic", "Fasting"])
-        self.condition_combo.setFont(QFont("Segoe UI", 11))
+        self.condition_combo.setFont(cached_font(11))
         self.condition_combo.setFixedHeight(40)
         layout.addWidget(self.condition_combo)
         
         # Analyze button
         self.analyze_btn = QPushButton("🔬 ANALYZE")
-        self.analyze_btn.setFont(QFont("Segoe UI", 12, QFont.Bold))
+        self.analyze_btn.setFont(cached_font(12, QFont.Bold))
         self.analyze_btn.setFixedHeight(50)
         self.analyze_btn.clicked.connect(self.analyze_glucose)
         self.analyze_btn.setCursor(Qt.PointingHandCursor)
@@ -639,7 +2100,7 @@ class MainWindow(QMainWindow):
         
         # Clear history button
         clear_btn = QPushButton("🗑️ Clear History")
-        clear_btn.setFont(QFont("Segoe UI", 10))
+        clear_btn.setFont(cached_font(10))
         clear_btn.setFixedHeight(40)
         clear_btn.clicked.connect(self.clear_history)
         clear_btn.setCursor(Qt.PointingHandCursor)
@@ -653,7 +2114,7 @@ class MainWindow(QMainWindow):
         info_layout = QVBoxLayout(info_frame)
         
         info_title = QLabel("ℹ️ Reference Ranges (ISO 15197/ADA)")
-        info_title.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        info_title.setFont(cached_font(10, QFont.Bold))
         info_layout.addWidget(info_title)
         
         ranges = [
@@ -666,7 +2127,7 @@ class MainWindow(QMainWindow):
         
         for range_text in ranges:
             label = QLabel(range_text)
-            label.setFont(QFont("Segoe UI", 9))
+            label.setFont(cached_font(9))
             label.setStyleSheet("color: #aaa;")
             info_layout.addWidget(label)
         
@@ -683,7 +2144,7 @@ class MainWindow(QMainWindow):
         
         # Title
         title = QLabel("📈 Analysis Result")
-        title.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        title.setFont(cached_font(14, QFont.Bold))
         title.setStyleSheet("color: #00D4FF;")
         layout.addWidget(title)
         
@@ -694,12 +2155,12 @@ class MainWindow(QMainWindow):
         indicator_layout = QVBoxLayout(self.status_indicator)
         
         self.status_value_label = QLabel("--")
-        self.status_value_label.setFont(QFont("Segoe UI", 48, QFont.Bold))
+        self.status_value_label.setFont(cached_font(48, QFont.Bold))
         self.status_value_label.setAlignment(Qt.AlignCenter)
         indicator_layout.addWidget(self.status_value_label)
         
         self.status_unit_label = QLabel("mg/dL")
-        self.status_unit_label.setFont(QFont("Segoe UI", 16))
+        self.status_unit_label.setFont(cached_font(16))
         self.status_unit_label.setAlignment(Qt.AlignCenter)
         self.status_unit_label.setStyleSheet("color: #888;")
         indicator_layout.addWidget(self.status_unit_label)
@@ -708,14 +2169,14 @@ class MainWindow(QMainWindow):
         
         # Status text
         self.status_text_label = QLabel("AWAITING INPUT")
-        self.status_text_label.setFont(QFont("Segoe UI", 18, QFont.Bold))
+        self.status_text_label.setFont(cached_font(18, QFont.Bold))
         self.status_text_label.setAlignment(Qt.AlignCenter)
         self.status_text_label.setStyleSheet("color: #888;")
         layout.addWidget(self.status_text_label)
         
         # Message box
         self.message_label = QLabel("Enter a glucose value and click Analyze")
-        self.message_label.setFont(QFont("Segoe UI", 11))
+        self.message_label.setFont(cached_font(11))
         self.message_label.setAlignment(Qt.AlignCenter)
         self.message_label.setWordWrap(True)
         self.message_label.setStyleSheet("color: #aaa; padding: 15px;")
@@ -723,7 +2184,7 @@ class MainWindow(QMainWindow):
         
         # Timestamp
         self.timestamp_label = QLabel("")
-        self.timestamp_label.setFont(QFont("Segoe UI", 9))
+        self.timestamp_label.setFont(cached_font(9))
         self.timestamp_label.setAlignment(Qt.AlignCenter)
         self.timestamp_label.setStyleSheet("color: #666;")
         layout.addWidget(self.timestamp_label)
@@ -740,7 +2201,7 @@ class MainWindow(QMainWindow):
         
         # Title
         title = QLabel("📉 Glucose Trend")
-        title.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        title.setFont(cached_font(14, QFont.Bold))
         title.setStyleSheet("color: #00D4FF;")
         layout.addWidget(title)
         
@@ -758,19 +2219,22 @@ class MainWindow(QMainWindow):
         
         # Title
         title = QLabel("📋 Measurement History")
-        title.setFont(QFont("Segoe UI", 14, QFont.Bold))
+        title.setFont(cached_font(14, QFont.Bold))
         title.setStyleSheet("color: #00D4FF;")
         layout.addWidget(title)
         
         # Table
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(4)
-        self.history_table.setHorizontalHeaderLabels(["Timestamp", "Glucose (mg/dL)", "Status", "Condition"])
+        self.history_model = HistoryModel(self.history, self)
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_model)
         self.history_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.history_table.setFont(QFont("Segoe UI", 10))
+        # Fixed row heights - Qt never has to measure rows individually
+        self.history_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.history_table.setFont(cached_font(10))
         self.history_table.setAlternatingRowColors(True)
-        self.history_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.history_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.history_table.setSelectionBehavior(QTableView.SelectRows)
+        self.history_table.setEditTriggers(QTableView.NoEditTriggers)
+        self.history_table.verticalScrollBar().valueChanged.connect(self.on_history_scrolled)
         layout.addWidget(self.history_table)
         
         return panel
@@ -783,7 +2247,7 @@ class MainWindow(QMainWindow):
         
         # Title
         title = QLabel("📊 Statistical Analysis Dashboard")
-        title.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        title.setFont(cached_font(16, QFont.Bold))
         title.setStyleSheet("color: #00D4FF;")
         layout.addWidget(title)
         
@@ -821,12 +2285,12 @@ class MainWindow(QMainWindow):
             stat_layout = QVBoxLayout(stat_frame)
             
             name_label = QLabel(display_name)
-            name_label.setFont(QFont("Segoe UI", 10))
+            name_label.setFont(cached_font(10))
             name_label.setStyleSheet("color: #aaa;")
             name_label.setAlignment(Qt.AlignCenter)
             
             value_label = QLabel("--")
-            value_label.setFont(QFont("Segoe UI", 20, QFont.Bold))
+            value_label.setFont(cached_font(20, QFont.Bold))
             value_label.setStyleSheet("color: #00D4FF;")
             value_label.setAlignment(Qt.AlignCenter)
             
@@ -845,7 +2309,7 @@ class MainWindow(QMainWindow):
         
         # Refresh button
         refresh_btn = QPushButton("🔄 Refresh Statistics")
-        refresh_btn.setFont(QFont("Segoe UI", 11, QFont.Bold))
+        refresh_btn.setFont(cached_font(11, QFont.Bold))
         refresh_btn.setFixedHeight(45)
         refresh_btn.clicked.connect(self.update_statistics)
         scroll_layout.addWidget(refresh_btn)
@@ -854,6 +2318,9 @@ class MainWindow(QMainWindow):
         scroll.setWidget(scroll_content)
         layout.addWidget(scroll)
         
+        # Load statistics
+        self.update_statistics()
+        
         return tab
     
     def create_goals_tab(self):
@@ -864,24 +2331,40 @@ class MainWindow(QMainWindow):
         
         # Title
         title = QLabel("🎯 Goals & Targets")
-        title.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        title.setFont(cached_font(16, QFont.Bold))
         title.setStyleSheet("color: #00D4FF;")
         layout.addWidget(title)
         
-        # Goals display area
-        self.goals_layout = QVBoxLayout()
+        # Goals display area - a list view painting one card per goal, so
+        # only visible goals cost anything
+        self.goals_model = GoalsModel(self)
+        self.goals_delegate = GoalDelegate(self)
+        self.goals_delegate.dark_mode = self.dark_mode
+        
+        self.goals_view = QListView()
+        self.goals_view.setObjectName("goalsList")
+        self.goals_view.setModel(self.goals_model)
+        self.goals_view.setItemDelegate(self.goals_delegate)
+        self.goals_view.setSelectionMode(QListView.NoSelection)
+        self.goals_view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        self.goals_view.setResizeMode(QListView.Adjust)
+        
+        # Placeholder shown instead of the list when the patient has no goals
+        self.no_goals_label = QLabel("No goals set. Click 'Add New Goal' to create one.")
+        self.no_goals_label.setFont(cached_font(11))
+        self.no_goals_label.setStyleSheet("color: #888; padding: 20px;")
+        self.no_goals_label.setAlignment(Qt.AlignCenter)
+        self.no_goals_label.hide()
         
-        goals_scroll = QScrollArea()
-        goals_scroll.setWidgetResizable(True)
-        goals_content = QWidget()
-        goals_content.setLayout(self.goals_layout)
-        goals_scroll.setWidget(goals_content)
+        self.goals_layout = QVBoxLayout()
+        self.goals_layout.addWidget(self.goals_view)
+        self.goals_layout.addWidget(self.no_goals_label)
         
-        layout.addWidget(goals_scroll)
+        layout.addLayout(self.goals_layout, 1)
         
         # Add goal button
         add_goal_btn = QPushButton("+ Add New Goal")
-        add_goal_btn.setFont(QFont("Segoe UI", 11, QFont.Bold))
+        add_goal_btn.setFont(cached_font(11, QFont.Bold))
         add_goal_btn.setFixedHeight(45)
         add_goal_btn.clicked.connect(self.show_add_goal_dialog)
         layout.addWidget(add_goal_btn)
@@ -899,7 +2382,7 @@ class MainWindow(QMainWindow):
         
         # Title
         title = QLabel("📉 Advanced Data Visualization")
-        title.setFont(QFont("Segoe UI", 16, QFont.Bold))
+        title.setFont(cached_font(16, QFont.Bold))
         title.setStyleSheet("color: #00D4FF;")
         layout.addWidget(title)
         
@@ -907,7 +2390,7 @@ class MainWindow(QMainWindow):
         selector_layout = QHBoxLayout()
         
         graph_label = QLabel("Graph Type:")
-        graph_label.setFont(QFont("Segoe UI", 10))
+        graph_label.setFont(cached_font(10))
         selector_layout.addWidget(graph_label)
         
         self.graph_type_combo = QComboBox()
@@ -918,7 +2401,7 @@ class MainWindow(QMainWindow):
             "Weekly Comparison",
             "Monthly Trend"
         ])
-        self.graph_type_combo.setFont(QFont("Segoe UI", 10))
+        self.graph_type_combo.setFont(cached_font(10))
         self.graph_type_combo.currentTextChanged.connect(self.update_advanced_graph)
         selector_layout.addWidget(self.graph_type_combo)
         
@@ -931,9 +2414,14 @@ class MainWindow(QMainWindow):
         layout.addLayout(selector_layout)
         
         # Advanced graph widget
-        self.advanced_graph = TrendPlotWidget()
+        self.advanced_graph = DistributionPlotWidget()
         layout.addWidget(self.advanced_graph)
         
+        # Graph data is summarized on the thread pool and drawn when it comes back
+        self._graph_request = 0
+        self.graph_summary_signals = PlotSummarySignals(self)
+        self.graph_summary_signals.finished.connect(self.apply_advanced_graph)
+        
         return tab
         
     def analyze_glucose(self):
@@ -979,7 +2467,7 @@ class MainWindow(QMainWindow):
                 self.stop_alarm()
             
             # Auto-refresh statistics
-            self.update_statistics()
+            self.add_to_statistics(glucose_value)
             
             # Clear input
             self.glucose_input.clear()
@@ -992,6 +2480,13 @@ class MainWindow(QMainWindow):
         """Update the status panel with analysis results"""
         # Update value display
         self.status_value_label.setText(f"{result['value']:.1f}")
+        self.timestamp_label.setText(f"Last reading: {result['timestamp']}")
+        
+        # Same status as the last reading: text, message and colors are unchanged
+        status_key = (result['status'], result['color'])
+        if status_key == self._last_status:
+            return
+        self._last_status = status_key
         
         # Update status text
         self.status_text_label.setText(result['status'])
@@ -1000,45 +2495,13 @@ class MainWindow(QMainWindow):
         # Update message
         self.message_label.setText(result['message'])
         
-        # Update timestamp
-        self.timestamp_label.setText(f"Last reading: {result['timestamp']}")
-        
         # Update indicator background
-        self.status_indicator.setStyleSheet(f"""
-            QFrame#statusIndicator {{
-                background-color: {result['color']};
-                border-radius: 10px;
-                border: 3px solid white;
-            }}
-        """)
+        self._indicator_normal_qss = indicator_stylesheet(result['color'])
+        self.status_indicator.setStyleSheet(self._indicator_normal_qss)
         
     def add_to_history(self, result, condition):
         """Add measurement to history table"""
-        row = self.history_table.rowCount()
-        self.history_table.insertRow(row)
-        
-        # Add data
-        items = [
-            result['timestamp'],
-            f"{result['value']:.1f}",
-            result['status'],
-            condition
-        ]
-        
-        for col, text in enumerate(items):
-            item = QTableWidgetItem(text)
-            item.setTextAlignment(Qt.AlignCenter)
-            
-            # Color-code status column
-            if col == 2:
-                color = QColor(result['color'])
-                item.setForeground(color)
-                item.setFont(QFont("Segoe UI", 10, QFont.Bold))
-            
-            self.history_table.setItem(row, col, item)
-        
-        # Store in history list
-        self.history.append(result)
+        self.history_model.append(result['timestamp'], result['value'], result['status'], condition)
         
         # Scroll to bottom
         self.history_table.scrollToBottom()
@@ -1054,6 +2517,10 @@ class MainWindow(QMainWindow):
         self.alarm_timer.stop()
         self.flash_state = False
         
+        for sound in (self.critical_sound, self.warning_sound):
+            if sound is not None:
+                sound.stop()
+        
     def flash_alarm(self):
         """Toggle alarm flash state"""
         if not self.alarm_active:
@@ -1061,44 +2528,62 @@ class MainWindow(QMainWindow):
             
         self.flash_state = not self.flash_state
         
-        if self.flash_state:
-            # Flash on
-            self.status_indicator.setStyleSheet("""
-                QFrame#statusIndicator {
-                    background-color: #FF4444;
-                    border-radius: 10px;
-                    border: 5px solid #FFFF00;
-                }
-            """)
-        else:
-            # Flash off - restore current color
-            current_color = self.status_text_label.styleSheet().split("color: ")[1].split(";")[0]
-            self.status_indicator.setStyleSheet(f"""
-                QFrame#statusIndicator {{
-                    background-color: {current_color};
-                    border-radius: 10px;
-                    border: 3px solid white;
-                }}
-            """)
+        # Flash on, or flash off - restore current color
+        self.status_indicator.setStyleSheet(
+            _INDICATOR_FLASH_QSS if self.flash_state else self._indicator_normal_qss)
             
-    def play_alarm_sound(self):
-        """Play system beep for critical alerts"""
+    def init_alarm_sounds(self):
+        """Prepare non-blocking alarm sound effects, if Qt multimedia is available"""
+        self.critical_sound = None
+        self.warning_sound = None
+        self._sound_dir = None
+        if QSoundEffect is None:
+            return
+        
+        # Private (0700) directory per run, so other users' files never collide
+        # and a failed write only means falling back to the system beep
         try:
-            # Determine if critical based on current status
-            status_text = self.status_text_label.text()
-            
-            if 'CRITICAL' in status_text:
-                # Critical condition: play 3 urgent beeps
-                for i in range(3):
-                    winsound.Beep(1200, 200)  # 1200 Hz for 200ms (urgent tone)
-                    if i < 2:  # Don't wait after last beep
-                        QTimer.singleShot(250, lambda: None)  # Short pause between beeps
-            else:
-                # Warning condition: play single beep
-                winsound.Beep(800, 300)  # 800 Hz for 300ms (warning tone)
-        except:
-            # If winsound fails, silently continue
-            pass
+            self._sound_dir = tempfile.mkdtemp(prefix="glucometer_sounds_")
+            critical_path = os.path.join(self._sound_dir, "alarm_critical.wav")
+            warning_path = os.path.join(self._sound_dir, "alarm_warning.wav")
+            # Critical: 1200 Hz for 200ms + short pause (urgent tone)
+            write_tone_wav(critical_path, 1200, 200, gap_ms=50)
+            # Warning: single 800 Hz beep for 300ms (warning tone)
+            write_tone_wav(warning_path, 800, 300)
+        except OSError:
+            self.remove_alarm_sounds()
+            return
+        
+        # Critical tone looped 3 times
+        self.critical_sound = QSoundEffect(self)
+        self.critical_sound.setSource(QUrl.fromLocalFile(critical_path))
+        self.critical_sound.setLoopCount(3)
+        
+        self.warning_sound = QSoundEffect(self)
+        self.warning_sound.setSource(QUrl.fromLocalFile(warning_path))
+    
+    def remove_alarm_sounds(self):
+        """Delete the generated alarm WAV files"""
+        if self._sound_dir is not None:
+            shutil.rmtree(self._sound_dir, ignore_errors=True)
+            self._sound_dir = None
+    
+    def play_alarm_sound(self):
+        """Play alarm beeps for warning and critical alerts"""
+        # Determine if critical based on current status
+        critical = 'CRITICAL' in self.status_text_label.text()
+        
+        sound = self.critical_sound if critical else self.warning_sound
+        # A sound effect that failed to load (e.g. no audio backend) reports Error
+        if sound is not None and sound.status() not in (QSoundEffect.Null, QSoundEffect.Error):
+            sound.play()
+            return
+        
+        # Fallback: system beep (winsound is Windows-only), which blocks, so
+        # it runs on a worker thread
+        if sys.platform != "win32":
+            return
+        QThreadPool.globalInstance().start(BeepWorker(critical))
             
     def clear_history(self):
         """Clear all history and reset the application"""
@@ -1107,34 +2592,13 @@ class MainWindow(QMainWindow):
         msg_box.setText("Are you sure you want to clear all measurements?")
         msg_box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
         msg_box.setDefaultButton(QMessageBox.No)
-        msg_box.setStyleSheet("""
-            QMessageBox {
-                background-color: #2b2b2b;
-                color: white;
-            }
-            QMessageBox QLabel {
-                color: white;
-            }
-            QMessageBox QPushButton {
-                background-color: #00D4FF;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 20px;
-                min-width: 80px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #00B8E6;
-            }
-        """)
+        msg_box.setStyleSheet(_MSGBOX_QSS)
         reply = msg_box.exec_()
         
         if reply == QMessageBox.Yes:
-            # Clear table
-            self.history_table.setRowCount(0)
-            
-            # Clear history list
-            self.history.clear()
+            # Clear table and history
+            self.history_complete = True
+            self.history_model.clear()
             
             # Clear graph
             self.trend_plot.clear_plot()
@@ -1146,13 +2610,8 @@ class MainWindow(QMainWindow):
             self.message_label.setText("Enter a glucose value and click Analyze")
             self.timestamp_label.setText("")
             
-            self.status_indicator.setStyleSheet("""
-                QFrame#statusIndicator {
-                    background-color: #333;
-                    border-radius: 10px;
-                    border: 3px solid #555;
-                }
-            """)
+            self.status_indicator.setStyleSheet(_INDICATOR_IDLE_QSS)
+            self._last_status = None
             
             # Stop any active alarms
             self.stop_alarm()
@@ -1170,42 +2629,30 @@ class MainWindow(QMainWindow):
         elif icon_type == "error":
             msg_box.setIcon(QMessageBox.Critical)
         
-        msg_box.setStyleSheet("""
-            QMessageBox {
-                background-color: #2b2b2b;
-                color: white;
-            }
-            QMessageBox QLabel {
-                color: white;
-            }
-            QMessageBox QPushButton {
-                background-color: #00D4FF;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 20px;
-                min-width: 80px;
-            }
-            QMessageBox QPushButton:hover {
-                background-color: #00B8E6;
-            }
-        """)
+        msg_box.setStyleSheet(_MSGBOX_QSS)
         msg_box.exec_()
     
     # ========== NEW FEATURE METHODS ==========
     
     def load_patients_combo(self):
         """Load patients into combo box"""
-        self.patient_combo.clear()
         patients = self.db.get_patients()
-        for patient in patients:
-            self.patient_combo.addItem(patient[1])  # patient name
         
-        # Set current patient
-        if self.current_patient_name:
-            index = self.patient_combo.findText(self.current_patient_name)
-            if index >= 0:
-                self.patient_combo.setCurrentIndex(index)
+        # Repopulate silently - otherwise every intermediate selection
+        # triggers a full switch_patient reload
+        with QSignalBlocker(self.patient_combo):
+            self.patient_combo.clear()
+            self.patient_combo.addItems([patient['name'] for patient in patients])
+            
+            # Set current patient
+            if self.current_patient_name:
+                index = self.patient_combo.findText(self.current_patient_name)
+                if index >= 0:
+                    self.patient_combo.setCurrentIndex(index)
+        
+        # Switch once if the selection ended up on a different patient
+        if self.patient_combo.currentText() != self.current_patient_name:
+            self.switch_patient(self.patient_combo.currentText())
     
     def switch_patient(self, patient_name):
         """Switch to a different patient"""
@@ -1218,8 +2665,8 @@ class MainWindow(QMainWindow):
         
         patient = self.db.get_patient_by_name(patient_name)
         if patient:
-            self.current_patient_id = patient[0]
-            self.current_patient_name = patient[1]
+            self.current_patient_id = patient['id']
+            self.current_patient_name = patient['name']
             self.load_patient_data()
             self.update_statistics()
             self.load_goals()
@@ -1283,59 +2730,7 @@ class MainWindow(QMainWindow):
         layout.addLayout(btn_layout)
         
         # Apply dark theme to dialog
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e1e;
-                color: white;
-            }
-            QLabel {
-                color: white;
-                font-size: 11pt;
-            }
-            QLineEdit, QSpinBox, QComboBox {
-                background-color: #333;
-                color: white;
-                border: 2px solid #444;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 10pt;
-            }
-            QLineEdit:focus, QSpinBox:focus, QComboBox:focus {
-                border: 2px solid #00D4FF;
-            }
-            QPushButton {
-                background-color: #00D4FF;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 10px 20px;
-                font-size: 11pt;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #00B8E6;
-            }
-            QPushButton:pressed {
-                background-color: #0099CC;
-            }
-            QComboBox::drop-down {
-                border: none;
-                padding-right: 10px;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid white;
-                margin-right: 5px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #333;
-                color: white;
-                selection-background-color: #00D4FF;
-                border: 1px solid #444;
-            }
-        """)
+        dialog.setStyleSheet(_PATIENT_DIALOG_QSS)
         dialog.exec_()
     
     def load_patient_data(self):
@@ -1347,36 +2742,45 @@ class MainWindow(QMainWindow):
         if not hasattr(self, 'history_table'):
             return
         
-        # Clear current data
-        self.history_table.setRowCount(0)
-        self.trend_plot.clear_plot()
-        self.history.clear()
+        # Load the most recent page from database
+        readings = self.db.get_readings(self.current_patient_id, limit=self.HISTORY_PAGE_SIZE, order='ASC')
+        self.history_complete = len(readings) < self.HISTORY_PAGE_SIZE
+        total = len(readings) if self.history_complete else self.db.count_readings(self.current_patient_id)
         
-        # Load from database
-        readings = self.db.get_readings(self.current_patient_id)
+        # Swap the whole history into the table in one model reset, then
+        # hand the plot the value column in a single call
+        self.history_model.load_rows(readings)
+        self.trend_plot.set_series(self.history.values, total)
         
-        for reading in reversed(readings):  # Reverse to show oldest first
-            # reading: (id, patient_id, glucose_value, status, condition, timestamp)
-            result = {
-                'value': reading[2],
-                'status': reading[3],
-                'timestamp': reading[5],
-                'color': self.get_color_for_status(reading[3])
-            }
-            self.add_to_history(result, reading[4])
-            self.trend_plot.add_reading(reading[2])
-    
-    def get_color_for_status(self, status):
-        """Get color code for status"""
-        if 'CRITICAL' in status:
-            return '#FF4444'
-        elif 'WARNING' in status:
-            return '#FFA500'
-        else:
-            return '#4CAF50'
+        self.history_table.scrollToBottom()
+    
+    def on_history_scrolled(self, value):
+        """Load the next page of older readings once the table reaches the top"""
+        if value == 0 and not self.history_complete:
+            self.load_older_history()
+    
+    def load_older_history(self):
+        """Insert the next page of older readings above the loaded history"""
+        readings = self.db.get_readings(self.current_patient_id, limit=self.HISTORY_PAGE_SIZE,
+                                        offset=len(self.history), order='ASC')
+        self.history_complete = len(readings) < self.HISTORY_PAGE_SIZE
+        
+        self.history_model.prepend_rows(readings)
+        
+        # Keep the previously topmost reading in view
+        if readings:
+            self.history_table.scrollTo(self.history_model.index(len(readings), 0),
+                                        QTableView.PositionAtTop)
     
     def update_statistics(self):
+        """Schedule a statistics dashboard reload from the database"""
+        self._stats_reload = True
+        self._stats_timer.start(150)
+    
+    def _do_update_statistics(self):
         """Update statistics dashboard"""
+        reload, self._stats_reload = self._stats_reload, False
+        
         if not self.current_patient_id:
             return
         
@@ -1384,30 +2788,57 @@ class MainWindow(QMainWindow):
         if not hasattr(self, 'stat_labels'):
             return
         
-        readings = self.db.get_readings(self.current_patient_id, days=30)  # Last 30 days
+        # Between reloads only new readings have been folded in, so reseed once
+        # the window is as old as the database's 30-day cache to drop expired readings
+        seeded_age = time.monotonic() - self._running_stats_seeded_at
+        if (not reload and self.running_stats is not None
+                and seeded_age < DatabaseManager.READINGS_CACHE_TTL):
+            self.display_statistics(self.running_stats.stats())
+            return
         
-        if not readings:
+        # Last 30 days - cached by the database manager, which expires the
+        # window after READINGS_CACHE_TTL and drops it when readings are added
+        values = self.db.get_reading_values(self.current_patient_id, days=30)
+        
+        # Reseed the running statistics used between full refreshes
+        self.running_stats = RunningStatistics(values)
+        self._running_stats_seeded_at = time.monotonic()
+        
+        self.display_statistics(self.running_stats.stats())
+    
+    def add_to_statistics(self, glucose_value):
+        """Fold a new reading into the dashboard without re-querying the database"""
+        if self.running_stats is None:
+            self.update_statistics()
+            return
+        
+        self.running_stats.add(glucose_value)
+        self._stats_timer.start(150)
+    
+    def display_statistics(self, stats):
+        """Show a statistics dict on the dashboard (None clears it)"""
+        if not hasattr(self, 'stat_labels'):
+            return
+        
+        if not stats:
             # Clear statistics
             for key in self.stat_labels:
                 self.stat_labels[key].setText("--")
             return
         
-        stats = StatisticsCalculator.calculate_statistics(readings)
-        
-        if stats:
-            self.stat_labels['count'].setText(str(stats['count']))
-            self.stat_labels['average'].setText(f"{stats['average']:.1f} mg/dL")
-            self.stat_labels['median'].setText(f"{stats['median']:.1f} mg/dL")
-            self.stat_labels['std_dev'].setText(f"{stats['std_dev']:.1f}")
-            self.stat_labels['min'].setText(f"{stats['min']:.1f} mg/dL")
-            self.stat_labels['max'].setText(f"{stats['max']:.1f} mg/dL")
-            self.stat_labels['time_in_range'].setText(f"{stats['time_in_range']:.1f}%")
-            self.stat_labels['estimated_a1c'].setText(f"{stats['estimated_a1c']}%")
-            self.stat_labels['critical_low'].setText(str(stats['critical_low']))
-            self.stat_labels['warning_low'].setText(str(stats['warning_low']))
-            self.stat_labels['normal'].setText(str(stats['normal']))
-            self.stat_labels['warning_high'].setText(str(stats['warning_high']))
-            self.stat_labels['critical_high'].setText(str(stats['critical_high']))
+        self.stat_labels['count'].setText(str(stats['count']))
+        self.stat_labels['average'].setText(f"{stats['average']:.1f} mg/dL")
+        self.stat_labels['median'].setText(f"{stats['median']:.1f} mg/dL")
+        self.stat_labels['std_dev'].setText(f"{stats['std_dev']:.1f}")
+        self.stat_labels['min'].setText(f"{stats['min']:.1f} mg/dL")
+        self.stat_labels['max'].setText(f"{stats['max']:.1f} mg/dL")
+        self.stat_labels['time_in_range'].setText(f"{stats['time_in_range']:.1f}%")
+        self.stat_labels['estimated_a1c'].setText(f"{stats['estimated_a1c']}%")
+        self.stat_labels['critical_low'].setText(str(stats['critical_low']))
+        self.stat_labels['warning_low'].setText(str(stats['warning_low']))
+        self.stat_labels['normal'].setText(str(stats['normal']))
+        self.stat_labels['warning_high'].setText(str(stats['warning_high']))
+        self.stat_labels['critical_high'].setText(str(stats['critical_high']))
     
     def show_export_dialog(self):
         """Show export options dialog"""
@@ -1419,7 +2850,7 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(dialog)
         
         title = QLabel("Select Export Format:")
-        title.setFont(QFont("Segoe UI", 12, QFont.Bold))
+        title.setFont(cached_font(12, QFont.Bold))
         layout.addWidget(title)
         
         # Export options
@@ -1444,32 +2875,7 @@ class MainWindow(QMainWindow):
         cancel_btn.clicked.connect(dialog.reject)
         layout.addWidget(cancel_btn)
         
-        dialog.setStyleSheet("""
-            QDialog {
-                background-color: #1e1e1e;
-                color: white;
-            }
-            QLabel {
-                color: white;
-                font-size: 11pt;
-            }
-            QPushButton {
-                background-color: #00D4FF;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 12px 20px;
-                font-size: 12pt;
-                font-weight: bold;
-                min-width: 100px;
-            }
-            QPushButton:hover {
-                background-color: #00B8E6;
-            }
-            QPushButton:pressed {
-                background-color: #0099CC;
-            }
-        """)
+        dialog.setStyleSheet(_EXPORT_DIALOG_QSS)
         dialog.exec_()
     
     def export_data(self, format_type, dialog):
@@ -1503,42 +2909,71 @@ class MainWindow(QMainWindow):
                                                       f"{self.current_patient_name}_glucose_report.pdf",
                                                       "PDF Files (*.pdf)")
             if file_path:
-                self.export_to_pdf(readings, file_path)
+                self.start_pdf_export(readings, file_path, dialog)
+            return
         
         if file_path:
-            self.show_message_box("Success", f"Data exported successfully to:\n{file_path}", "information")
-            dialog.accept()
+            self.finish_export(file_path, dialog)
+    
+    def finish_export(self, file_path, dialog):
+        """Report a completed export and close the export dialog"""
+        self.show_message_box("Success", f"Data exported successfully to:\n{file_path}", "information")
+        dialog.accept()
     
     def export_to_csv(self, readings, file_path):
         """Export to CSV file"""
-        with open(file_path, 'w', newline='') as csvfile:
+        with open(file_path, 'w', newline='', buffering=1 << 20, encoding='utf-8') as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(['Timestamp', 'Glucose (mg/dL)', 'Status', 'Condition'])
-            
-            for reading in readings:
-                writer.writerow([reading[5], reading[2], reading[3], reading[4]])
+            writer.writerows(map(_get_export_columns, readings))
     
     def export_to_json(self, readings, file_path):
         """Export to JSON file"""
         data = {
             'patient_name': self.current_patient_name,
             'export_date': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'readings': []
+            'readings': [
+                {
+                    'timestamp': reading['timestamp'],
+                    'glucose_value': reading['glucose_value'],
+                    'status': reading['status'],
+                    'condition': reading['condition']
+                }
+                for reading in readings
+            ]
         }
         
-        for reading in readings:
-            data['readings'].append({
-                'timestamp': reading[5],
-                'glucose_value': reading[2],
-                'status': reading[3],
-                'condition': reading[4]
-            })
+        # Compact separators - indenting roughly doubles the size of large exports
+        with open(file_path, 'w', encoding='utf-8') as jsonfile:
+            json.dump(data, jsonfile, separators=(',', ':'))
+    
+    def start_pdf_export(self, readings, file_path, dialog):
+        """Build the PDF report on a worker thread, reporting back when done"""
+        if self.export_thread is not None and self.export_thread.isRunning():
+            self.show_message_box("Error", "A PDF export is already in progress")
+            return
         
-        with open(file_path, 'w') as jsonfile:
-            json.dump(data, jsonfile, indent=4)
+        patient_name = self.current_patient_name
+        self.export_thread = ExportThread(
+            lambda readings, file_path: self.export_to_pdf(readings, file_path, patient_name),
+            readings, file_path, self)
+        self.export_thread.succeeded.connect(lambda path: self.finish_export(path, dialog))
+        self.export_thread.failed.connect(
+            lambda error: self.show_message_box("Error", f"PDF export failed:\n{error}"))
+        self.export_thread.start()
     
-    def export_to_pdf(self, readings, file_path):
-        """Export to PDF report"""
+    def export_to_pdf(self, readings, file_path, patient_name=None):
+        """Export to PDF report (safe to call from a worker thread)"""
+        if patient_name is None:
+            patient_name = self.current_patient_name
+        
+        # reportlab is only needed here, so it is imported on first export
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib import colors
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.platypus import SimpleDocTemplate, LongTable, TableStyle, Paragraph, Spacer
+        from reportlab.lib.units import inch
+        
         doc = SimpleDocTemplate(file_path, pagesize=letter)
         elements = []
         styles = getSampleStyleSheet()
@@ -1549,7 +2984,7 @@ class MainWindow(QMainWindow):
         elements.append(Spacer(1, 0.2*inch))
         
         # Patient info
-        patient_info = Paragraph(f"<b>Patient:</b> {self.current_patient_name}<br/>" + 
+        patient_info = Paragraph(f"<b>Patient:</b> {patient_name}<br/>" + 
                                 f"<b>Report Date:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br/>" +
                                 f"<b>Total Readings:</b> {len(readings)}", styles['Normal'])
         elements.append(patient_info)
@@ -1566,12 +3001,13 @@ class MainWindow(QMainWindow):
             elements.append(Paragraph(stats_text, styles['Normal']))
             elements.append(Spacer(1, 0.3*inch))
         
-        # Table data
+        # Table data for every reading, newest first - LongTable lays it out
+        # page by page and repeats the header row on each page
         table_data = [['Timestamp', 'Glucose', 'Status', 'Condition']]
-        for reading in readings[:50]:  # Limit to 50 most recent
-            table_data.append([reading[5], f"{reading[2]:.1f}", reading[3], reading[4]])
+        table_data.extend([reading['timestamp'], f"{reading['glucose_value']:.1f}",
+                           reading['status'], reading['condition']] for reading in readings)
         
-        table = Table(table_data, colWidths=[2.5*inch, 1*inch, 1.5*inch, 1.5*inch])
+        table = LongTable(table_data, colWidths=[2.5*inch, 1*inch, 1.5*inch, 1.5*inch], repeatRows=1)
         table.setStyle(TableStyle([
             ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
@@ -1596,25 +3032,15 @@ class MainWindow(QMainWindow):
         else:
             self.theme_btn.setText("🌙 Dark Mode")
             self.apply_light_theme()
+        
+        # Goal cards are painted, not styled - repaint them in the new colors
+        if hasattr(self, 'goals_view'):
+            self.goals_delegate.dark_mode = self.dark_mode
+            self.goals_view.viewport().update()
     
     def apply_light_theme(self):
         """Apply light theme"""
-        self.setStyleSheet("""
-            QMainWindow { background-color: #f5f5f5; }
-            QFrame#headerFrame { background-color: #ffffff; border: 1px solid #ddd; border-radius: 10px; padding: 15px; }
-            QFrame#inputPanel, QFrame#statusPanel, QFrame#graphPanel, QFrame#historyPanel, QFrame#statCard {
-                background-color: #ffffff; border: 1px solid #ddd; border-radius: 10px; padding: 15px;
-            }
-            QLabel { color: #333; }
-            QLineEdit, QComboBox, QSpinBox { background-color: #fff; color: #333; border: 2px solid #ccc; border-radius: 5px; padding: 8px; }
-            QPushButton { background-color: #007acc; color: white; border: none; border-radius: 5px; padding: 10px; }
-            QPushButton:hover { background-color: #005a9e; }
-            QTableWidget { background-color: #fff; color: #333; gridline-color: #ddd; border: 1px solid #ddd; }
-            QHeaderView::section { background-color: #e0e0e0; color: #333; padding: 8px; border: 1px solid #ccc; }
-            QTabWidget::pane { border: 1px solid #ddd; background-color: #fff; }
-            QTabBar::tab { background-color: #e0e0e0; color: #333; padding: 10px 20px; border: 1px solid #ccc; }
-            QTabBar::tab:selected { background-color: #fff; border-bottom: 3px solid #007acc; }
-        """)
+        QApplication.instance().setStyleSheet(_LIGHT_THEME_QSS)
     
     def load_goals(self):
         """Load and display goals"""
@@ -1622,68 +3048,26 @@ class MainWindow(QMainWindow):
         if not hasattr(self, 'goals_layout'):
             return
         
-        # Clear existing goals
-        while self.goals_layout.count():
-            child = self.goals_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-        
-        if not self.current_patient_id:
-            return
-        
-        goals = self.db.get_goals(self.current_patient_id)
+        goals = self.db.get_goals(self.current_patient_id) if self.current_patient_id else []
         
-        if not goals:
-            no_goals_label = QLabel("No goals set. Click 'Add New Goal' to create one.")
-            no_goals_label.setFont(QFont("Segoe UI", 11))
-            no_goals_label.setStyleSheet("color: #888; padding: 20px;")
-            no_goals_label.setAlignment(Qt.AlignCenter)
-            self.goals_layout.addWidget(no_goals_label)
-            return
-        
-        for goal in goals:
-            goal_widget = self.create_goal_widget(goal)
-            self.goals_layout.addWidget(goal_widget)
-    
-    def create_goal_widget(self, goal):
-        """Create a widget for displaying a goal"""
-        # goal: (id, patient_id, goal_type, target_value, current_value, start_date, end_date, achieved)
-        goal_frame = QFrame()
-        goal_frame.setObjectName("statCard")
-        layout = QVBoxLayout(goal_frame)
-        
-        # Goal title
-        title = QLabel(f"🎯 {goal[2]}")
-        title.setFont(QFont("Segoe UI", 12, QFont.Bold))
-        layout.addWidget(title)
-        
-        # Progress
-        progress_label = QLabel(f"Target: {goal[3]:.1f} | Current: {goal[4]:.1f}")
-        progress_label.setFont(QFont("Segoe UI", 10))
-        layout.addWidget(progress_label)
-        
-        # Progress bar
-        progress_bar = QProgressBar()
-        progress_bar.setMaximum(int(goal[3]))
-        progress_bar.setValue(int(goal[4]))
-        layout.addWidget(progress_bar)
-        
-        # Dates
-        dates_label = QLabel(f"Period: {goal[5]} to {goal[6]}")
-        dates_label.setFont(QFont("Segoe UI", 9))
-        dates_label.setStyleSheet("color: #888;")
-        layout.addWidget(dates_label)
-        
-        # Achievement status
-        if goal[7]:
-            achieved_label = QLabel("✓ Achieved!")
-            achieved_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
-            layout.addWidget(achieved_label)
-        
-        return goal_frame
+        # One model reset repaints all goal cards
+        self.goals_model.set_goals(goals)
+        self.goals_view.setVisible(bool(goals))
+        self.no_goals_label.setVisible(bool(self.current_patient_id) and not goals)
     
     def show_add_goal_dialog(self):
         """Show dialog to add new goal"""
+        # Built on first use, then reused with its fields reset
+        if self._add_goal_dialog is None:
+            self._add_goal_dialog = self._build_add_goal_dialog()
+        
+        self._goal_type_combo.setCurrentIndex(0)
+        self._goal_target_input.setValue(80)
+        self._goal_end_label.setText((datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d"))
+        self._add_goal_dialog.exec_()
+        
+    def _build_add_goal_dialog(self):
+        """Create the add-goal dialog, keeping its input widgets on self"""
         dialog = QDialog(self)
         dialog.setWindowTitle("Add New Goal")
         dialog.setModal(True)
@@ -1693,8 +3077,8 @@ class MainWindow(QMainWindow):
         
         # Goal type
         type_label = QLabel("Goal Type:")
-        type_combo = QComboBox()
-        type_combo.addItems([
+        self._goal_type_combo = QComboBox()
+        self._goal_type_combo.addItems([
             "Maintain Time in Range >80%",
             "Keep Average Below 140 mg/dL",
             "Reduce Critical Events",
@@ -1704,44 +3088,49 @@ class MainWindow(QMainWindow):
         
         # Target value
         target_label = QLabel("Target Value:")
-        target_input = QDoubleSpinBox()
-        target_input.setRange(0, 1000)
-        target_input.setValue(80)
-        target_input.setSuffix(" %")
+        self._goal_target_input = QDoubleSpinBox()
+        self._goal_target_input.setRange(0, 1000)
+        self._goal_target_input.setSuffix(" %")
         
         # End date
         end_label = QLabel("End Date:")
-        end_date = QLabel((datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d"))
+        self._goal_end_label = QLabel()
         
         layout.addWidget(type_label)
-        layout.addWidget(type_combo)
+        layout.addWidget(self._goal_type_combo)
         layout.addWidget(target_label)
-        layout.addWidget(target_input)
+        layout.addWidget(self._goal_target_input)
         layout.addWidget(end_label)
-        layout.addWidget(end_date)
+        layout.addWidget(self._goal_end_label)
         
         # Buttons
         btn_layout = QHBoxLayout()
         save_btn = QPushButton("Save Goal")
         cancel_btn = QPushButton("Cancel")
         
-        def save_goal():
-            start = datetime.now().strftime("%Y-%m-%d")
-            end = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
-            self.db.add_goal(self.current_patient_id, type_combo.currentText(),
-                           target_input.value(), start, end)
-            self.load_goals()
-            dialog.accept()
-        
-        save_btn.clicked.connect(save_goal)
+        save_btn.clicked.connect(self.save_goal)
         cancel_btn.clicked.connect(dialog.reject)
         
         btn_layout.addWidget(save_btn)
         btn_layout.addWidget(cancel_btn)
         layout.addLayout(btn_layout)
         
-        dialog.setStyleSheet(self.styleSheet())
-        dialog.exec_()
+        return dialog
+        
+    def save_goal(self):
+        """Save the goal entered in the add-goal dialog"""
+        # One clock read, so start and end cannot straddle midnight
+        now = datetime.now()
+        start = now.strftime("%Y-%m-%d")
+        end = (now + timedelta(days=30)).strftime("%Y-%m-%d")
+        goal = self.db.add_goal(self.current_patient_id, self._goal_type_combo.currentText(),
+                                self._goal_target_input.value(), start, end)
+        
+        # Only the new goal's card is added - the others are unchanged
+        self.goals_model.append(goal)
+        self.goals_view.show()
+        self.no_goals_label.hide()
+        self._add_goal_dialog.accept()
     
     def update_advanced_graph(self):
         """Update advanced graph based on selected type"""
@@ -1750,233 +3139,36 @@ class MainWindow(QMainWindow):
         if not self.current_patient_id:
             return
         
-        readings = self.db.get_readings(self.current_patient_id, days=30)
-        if not readings:
+        values = self.db.get_reading_values(self.current_patient_id, days=30)
+        if not values.size:
             return
         
-        values = [r[2] for r in readings]
+        mode = self.ADVANCED_GRAPH_MODES.get(graph_type)
+        if mode is None:
+            self._graph_request += 1  # Drop any summary still in flight
+            self.advanced_graph.show_empty()
+            return
         
-        self.advanced_graph.ax.clear()
+        # Bin/summarize off the GUI thread; apply_advanced_graph draws the result
+        self._graph_request += 1
+        QThreadPool.globalInstance().start(
+            PlotSummaryWorker(self.graph_summary_signals, self._graph_request, mode, values))
         
-        if graph_type == "Distribution Histogram":
-            self.advanced_graph.ax.hist(values, bins=20, color='#00D4FF', edgecolor='white', alpha=0.7)
-            self.advanced_graph.ax.set_xlabel('Glucose (mg/dL)', color='white')
-            self.advanced_graph.ax.set_ylabel('Frequency', color='white')
-            self.advanced_graph.ax.set_title('Glucose Distribution', color='white', fontweight='bold')
-            
-        elif graph_type == "Box Plot":
-            box = self.advanced_graph.ax.boxplot([values], vert=True, patch_artist=True)
-            for patch in box['boxes']:
-                patch.set_facecolor('#00D4FF')
-            self.advanced_graph.ax.set_ylabel('Glucose (mg/dL)', color='white')
-            self.advanced_graph.ax.set_title('Glucose Variability', color='white', fontweight='bold')
-        
-        self.advanced_graph.ax.set_facecolor('#1e1e1e')
-        self.advanced_graph.ax.tick_params(colors='white')
-        self.advanced_graph.canvas.draw()
+    def apply_advanced_graph(self, request_id, mode, summary):
+        """Draw a summary computed by PlotSummaryWorker, unless a newer one was requested"""
+        if request_id != self._graph_request:
+            return
+        
+        # Only the data artists change - the plot widget blits them when it can
+        if mode == 'hist':
+            self.advanced_graph.show_histogram(*summary)
+        else:
+            self.advanced_graph.show_boxplot(summary)
             
     def apply_styles(self):
         """Apply modern CSS stylesheet to the application"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1e1e1e;
-            }
-            
-            QFrame#headerFrame {
-                background-color: #252525;
-                border-radius: 10px;
-                padding: 15px;
-            }
-            
-            QFrame#inputPanel, QFrame#statusPanel, QFrame#graphPanel, QFrame#historyPanel {
-                background-color: #252525;
-                border-radius: 10px;
-                padding: 15px;
-                border: 1px solid #333;
-            }
-            
-            QFrame#infoFrame, QFrame#statCard {
-                background-color: #2b2b2b;
-                border-radius: 8px;
-                padding: 10px;
-                border: 1px solid #444;
-            }
-            
-            QTabWidget::pane {
-                border: 1px solid #333;
-                background-color: #1e1e1e;
-            }
-            
-            QTabBar::tab {
-                background-color: #252525;
-                color: white;
-                padding: 10px 20px;
-                border: 1px solid #333;
-                border-bottom: none;
-                border-top-left-radius: 5px;
-                border-top-right-radius: 5px;
-            }
-            
-            QTabBar::tab:selected {
-                background-color: #1e1e1e;
-                border-bottom: 3px solid #00D4FF;
-            }
-            
-            QTabBar::tab:hover {
-                background-color: #2b2b2b;
-            }
-            
-            QSpinBox, QDoubleSpinBox {
-                background-color: #333;
-                color: white;
-                border: 2px solid #444;
-                border-radius: 5px;
-                padding: 8px;
-            }
-            
-            QProgressBar {
-                border: 2px solid #444;
-                border-radius: 5px;
-                text-align: center;
-                background-color: #333;
-                color: white;
-            }
-            
-            QProgressBar::chunk {
-                background-color: #00D4FF;
-                border-radius: 3px;
-            }
-            
-            QLabel {
-                color: #ffffff;
-            }
-            
-            QLineEdit {
-                background-color: #333;
-                color: white;
-                border: 2px solid #444;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 12px;
-            }
-            
-            QLineEdit:focus {
-                border: 2px solid #00D4FF;
-            }
-            
-            QComboBox {
-                background-color: #333;
-                color: white;
-                border: 2px solid #444;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 11px;
-            }
-            
-            QComboBox:hover {
-                border: 2px solid #00D4FF;
-            }
-            
-            QComboBox::drop-down {
-                border: none;
-                width: 30px;
-            }
-            
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 5px solid transparent;
-                border-right: 5px solid transparent;
-                border-top: 5px solid white;
-                margin-right: 10px;
-            }
-            
-            QComboBox QAbstractItemView {
-                background-color: #333;
-                color: white;
-                selection-background-color: #00D4FF;
-                border: 1px solid #444;
-            }
-            
-            QPushButton {
-                background-color: #00D4FF;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 10px;
-                font-weight: bold;
-            }
-            
-            QPushButton:hover {
-                background-color: #00B8E6;
-            }
-            
-            QPushButton:pressed {
-                background-color: #0099CC;
-            }
-            
-            QTableWidget {
-                background-color: #2b2b2b;
-                color: white;
-                gridline-color: #444;
-                border: 1px solid #444;
-                border-radius: 5px;
-                alternate-background-color: #2b2b2b;
-            }
-            
-            QTableWidget::item {
-                padding: 8px;
-                background-color: #2b2b2b;
-            }
-            
-            QTableWidget::item:alternate {
-                background-color: #252525;
-            }
-            
-            QTableWidget::item:selected {
-                background-color: #00D4FF;
-                color: white;
-            }
-            
-            QHeaderView::section {
-                background-color: #333;
-                color: white;
-                padding: 8px;
-                border: 1px solid #444;
-                font-weight: bold;
-            }
-            
-            QScrollBar:vertical {
-                background-color: #2b2b2b;
-                width: 12px;
-                border-radius: 6px;
-            }
-            
-            QScrollBar::handle:vertical {
-                background-color: #555;
-                border-radius: 6px;
-                min-height: 20px;
-            }
-            
-            QScrollBar::handle:vertical:hover {
-                background-color: #666;
-            }
-            
-            QScrollBar:horizontal {
-                background-color: #2b2b2b;
-                height: 12px;
-                border-radius: 6px;
-            }
-            
-            QScrollBar::handle:horizontal {
-                background-color: #555;
-                border-radius: 6px;
-                min-width: 20px;
-            }
-            
-            QScrollBar::handle:horizontal:hover {
-                background-color: #666;
-            }
-        """)
+        # Set application-wide so dialogs inherit it without re-parsing a copy
+        QApplication.instance().setStyleSheet(_DARK_THEME_QSS)
 
 
 def main():